@@ -4,52 +4,110 @@
 # Description: This program writes a class named ChessVar for playing an abstract board game that is a variant of
 # chess--atomic chess.
 
+from attacks import AttackMaps
+from board import BitBoard, DictBoard
+from evaluation import Evaluator
+from fen import parse_fen, parse_castling, format_fen
+from moves import QUIET, DOUBLE_PAWN_PUSH, CAPTURE, PROMOTION, QUEEN_PROMOTION, square_to_index, move_to_squares
+from render import write_board
+from tables import (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, COLOR_INDEX, SQUARE_NAMES, SQUARE_INDEX, FILE_OF, RANK_OF,
+                    SQUARE_BITS, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_PUSHES, PAWN_DOUBLE_PUSHES, BETWEEN,
+                    ROOK_LINES, BISHOP_LINES, QUEEN_LINES, ZOBRIST_PIECES, ZOBRIST_BLACK_TO_MOVE, ZOBRIST_CASTLING,
+                    rook_attacks, bishop_attacks, queen_attacks, squares_of)
+from variants import ATOMIC, Castle
+
+# board engines ChessVar can be created with
+ENGINES = ("bitboard", "dict")
+
+# reasons _validate_move gives for turning a move down
+GAME_OVER = "game_over"
+OUT_OF_BOUNDS = "out_of_bounds"
+EMPTY_SQUARE = "empty_square"
+WRONG_TURN = "wrong_turn"
+BAD_PATTERN = "bad_pattern"
+KING_CAPTURE = "king_capture"
+
+# a game at the standard starting position for each engine, built the first time reset needs it
+_START_POSITIONS = {}
+
+
 class ChessVar:
     """
     This class created the game board and keeps track of chess pieces, player turn, and state of the game.
     """
 
-    def __init__(self):
+    def __init__(self, engine="bitboard", fen=None, variant=None):
         """
-        Initializes the chess game. Creates the board, game state, and turns private data members.
+        Initializes the chess game. Creates the board, game state, and turns private data members. The engine picks how
+        the board is stored: "bitboard" (default, one 64-bit integer per piece type and color) or "dict" (the original
+        dictionary board, kept around for comparison). A FEN string can be passed to start from any position instead
+        of the standard one (see set_fen), and a Variant to play other rules than standard atomic chess (see
+        variants.py).
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown board engine '{engine}', expected one of {ENGINES}")
+
+        self._engine = engine
+
+        # the rules, and the variant's compiled tables the move path reads them through
+        self._variant = variant if variant is not None else ATOMIC
+        self._blast_masks = self._variant.get_blast_masks()
+        self._immune_codes = self._variant.get_immune_codes()
+        self._promotion_targets = self._variant.get_promotion_targets()
+        self._castles = self._variant.get_castles()
+        self._castling_masks = self._variant.get_castling_masks()
+
+        # undo stack - one entry per move made, holding only what that move changed (see unmake_move)
+        self._history = []
+
+        # plies played before the starting position, only used for the FEN move number
+        self._start_ply = 0
+
+        # attack maps, built the first time they are asked for (see _get_attack_maps). Moves only record which squares
+        # they changed, the maps catch up with them on the next query
+        self._attack_maps = None
+        self._attacks_changed = 0
+
+        if fen is not None:
+            self.set_fen(fen)
+            return
+
         self._board = self._create_board()
         self._game_state = "UNFINISHED"
         self._turn = "WHITE"
 
-        self._white_king_pos = "e1"
-        self._black_king_pos = "e8"
+        # castling rights bits (see fen.parse_castling), always 0 under a variant without castling
+        self._castling_rights = self._variant.get_start_rights()
+
+        # square indexes of the kings (e1 and e8)
+        self._white_king_pos = SQUARE_INDEX["e1"]
+        self._black_king_pos = SQUARE_INDEX["e8"]
+
+        # Zobrist hash of the position, kept up to date by make_move and _handle_explosion
+        self._hash = self._compute_hash()
+
+        # material and piece-square totals, kept up to date the same way (see evaluation.py)
+        self._evaluator = self._create_evaluator()
 
     def _create_board(self):
         """
         Create the chess board with the chess pieces in place. The chess board should be
         """
-        # using a dictionary instead of a 2D array since its easier to move around board given a key instead of indexes
-        board = {}
-
-        # white pieces
-        board['a1'] = Rook('white', 'a1')
-        board['b1'] = Knight('white', 'b1')
-        board['c1'] = Bishop('white', 'c1')
-        board['d1'] = Queen('white', 'd1')
-        board['e1'] = King('white', 'e1')
-        board['f1'] = Bishop('white', 'f1')
-        board['g1'] = Knight('white', 'g1')
-        board['h1'] = Rook('white', 'h1')
-        for letter in 'abcdefgh':
-            board[letter + '2'] = Pawn('white', letter + '2')
-
-        # black pieces
-        board['a8'] = Rook('black', 'a8')
-        board['b8'] = Knight('black', 'b8')
-        board['c8'] = Bishop('black', 'c8')
-        board['d8'] = Queen('black', 'd8')
-        board['e8'] = King('black', 'e8')
-        board['f8'] = Bishop('black', 'f8')
-        board['g8'] = Knight('black', 'g8')
-        board['h8'] = Rook('black', 'h8')
-        for letter in 'abcdefgh':
-            board[letter + '7'] = Pawn('black', letter + '7')
+        # using a dictionary instead of a 2D array since its easier to move around board given a key instead of indexes.
+        # the bitboard engine accepts the same square keys, so the layout below is shared by both engines
+        board = BitBoard() if self._engine == "bitboard" else DictBoard()
+
+        # every square holding the same type and color of chess piece shares one flyweight piece (see PIECES), the board
+        # is what knows where each piece stands
+        back_rank = (ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK)
+        for letter, kind in zip('abcdefgh', back_rank):
+            # white pieces
+            board[letter + '1'] = PIECES[kind]
+            board[letter + '2'] = PIECES[PAWN]
+
+            # black pieces
+            board[letter + '7'] = PIECES[6 + PAWN]
+            board[letter + '8'] = PIECES[6 + kind]
 
         # populating emtpy squares
         for letter in "abcdefgh":
@@ -58,28 +116,121 @@ class ChessVar:
 
         return board
 
+    def set_fen(self, fen):
+        """
+        Sets the game up at the position of a FEN string (see fen.py) and clears the move history. The board, turn and
+        king positions are built straight from the FEN, nothing is replayed. Castling rights are read too when the
+        variant has castling. A position missing a king (see get_fen on a finished game) sets up the finished game.
+        Raises ValueError for an invalid FEN.
+        """
+        pieces, turn, fullmove = parse_fen(fen)
+
+        # 1) build the board - the dictionary board needs every square present, the bitboard starts out empty
+        board = BitBoard() if self._engine == "bitboard" else DictBoard()
+        if self._engine == "dict":
+            for name in SQUARE_NAMES:
+                board[name] = None
+
+        evaluator = Evaluator()
+        position_hash = ZOBRIST_BLACK_TO_MOVE if turn == "BLACK" else 0
+        # a king that was blown up keeps its starting square, which holds no king of its color
+        self._white_king_pos = SQUARE_INDEX["e1"]
+        self._black_king_pos = SQUARE_INDEX["e8"]
+        for index, code in pieces:
+            board.set_piece(index, PIECES[code])
+            evaluator.add(code, index)
+            position_hash ^= ZOBRIST_PIECES[code][index]
+            if code == KING:
+                self._white_king_pos = index
+            elif code == 6 + KING:
+                self._black_king_pos = index
+
+        # 2) castling rights only stand while the king and rook they need are still at home
+        castling_rights = 0
+        if self._variant.has_castling():
+            castling_rights = parse_castling(fen)
+            for castle in self._castles.values():
+                if (board.piece_at(castle.king_from) is not PIECES[castle.king_code]
+                        or board.piece_at(castle.rook_from) is not PIECES[castle.rook_code]):
+                    castling_rights &= ~castle.right
+
+        # 3) set the rest of the state
+        self._board = board
+        self._turn = turn
+        self._castling_rights = castling_rights
+        self._hash = position_hash ^ ZOBRIST_CASTLING[castling_rights]
+        self._evaluator = evaluator
+        self._history = []
+        self._start_ply = 2 * (fullmove - 1) + (turn == "BLACK")
+        self._attack_maps = None
+        self._update_game_state()
+
+    def reset(self):
+        """
+        Puts the game back at the standard starting position and clears the move history. The game's own board and
+        evaluator are reused, refilled from a starting position built once per engine, which makes this much cheaper
+        than creating a new ChessVar when many games are played or replayed one after another. The variant is kept.
+        """
+        start = _START_POSITIONS.get(self._engine)
+        if start is None:
+            start = _START_POSITIONS[self._engine] = ChessVar(self._engine)
+
+        self._board.copy_from(start._board)
+        self._evaluator.copy_from(start._evaluator)
+        self._game_state = start._game_state
+        self._turn = start._turn
+        self._white_king_pos = start._white_king_pos
+        self._black_king_pos = start._black_king_pos
+        self._castling_rights = self._variant.get_start_rights()
+        self._hash = start._hash ^ ZOBRIST_CASTLING[self._castling_rights]
+        self._history.clear()
+        self._start_ply = 0
+        self._attack_maps = None
+        self._attacks_changed = 0
+
+    def get_fen(self):
+        """
+        Returns the FEN string of the current position. The castling field is "-" unless the variant has castling, the
+        en passant field always "-" and the halfmove clock 0, since atomic chess here has no en passant.
+        """
+        codes = []
+        for index in range(64):
+            chess_piece = self._board.piece_at(index)
+            codes.append(None if chess_piece is None else chess_piece.get_code())
+
+        return format_fen(codes, self._turn, (self._start_ply + len(self._history)) // 2 + 1, self._castling_rights)
+
     def print_board(self):
         """
         Prints the current state of the chess board.
         """
+        write_board(self)
 
-        print(" | a b c d e f g h |  ")
-        print("=====================")
-
-        for num in "87654321":
-            print(f"{num}|", end="")
-            for letter in "abcdefgh":
+    def get_snapshot(self):
+        """
+        Returns the board as 64 bytes, a1 to h8: 0 for an empty square, the piece code + 1 otherwise (see render.py).
+        """
+        return bytes([0 if chess_piece is None else chess_piece.get_code() + 1
+                      for chess_piece in self._board.get_squares()])
 
-                if self._board[f"{letter}{num}"] is None:
-                    ascii_art = "·"
-                else:
-                    ascii_art = self._board[f"{letter}{num}"].get_ascii_art()
+    def get_engine(self):
+        """
+        Returns the name of the board engine this game was created with ("bitboard" or "dict").
+        """
+        return self._engine
 
-                print(" " + ascii_art, end="")
-            print(f" |{num}")
+    def get_variant(self):
+        """
+        Returns the Variant this game is played under (see variants.py).
+        """
+        return self._variant
 
-        print("=====================")
-        print(" | a b c d e f g h |  ")
+    def get_rules_key(self):
+        """
+        Returns the key of the rules this game is played under ("atomic" for the standard rules). Positions with the
+        same hash but different rules keys must not share analysis.
+        """
+        return self._variant.get_key()
 
     def get_game_state(self):
         """
@@ -87,72 +238,539 @@ class ChessVar:
         """
         return self._game_state
 
-    def make_move(self, move_from, move_to):
+    def make_move(self, move_from, move_to=None):
         """
-        Takes in two strings that represents the placement on a chess board (like "b2" or " b4") and moves
-        that given chess piece from move_from to move_to. Before making the move, it checks to see if that chess piece
-        move is valid. If it is, it will move the piece and possibly cause an "explosion". If it isn't, it will return
-        False.
+        Takes in two squares, either as strings that represent the placement on a chess board (like "b2" or " b4") or
+        as square indexes 0-63 (see moves.square_to_index), and moves that given chess piece from move_from to move_to.
+        A single packed 16-bit move (see moves.encode_move) can be passed instead of the two squares. Before making the
+        move, it checks to see if that chess piece move is valid. If it is, it will move the piece and possibly cause an
+        "explosion". If it isn't, it will return False.
         """
 
-        # 0) check if game is still active
-        if self.get_game_state() != "UNFINISHED":
+        # 1) validate the move
+        validated_move = self._validate_move(move_from, move_to)
+        if validated_move.__class__ is not tuple:
             return False
 
-        # 1) gather data
-        move_from = move_from.lower()
-        move_to = move_to.lower()
+        # 2) handle move
+        self._play(*validated_move)
+
+        # 3) confirm move
+        return True
+
+    def is_move_legal(self, move_from, move_to=None):
+        """
+        Returns a boolean that tells whether make_move would accept the move, without making it. Takes the same
+        arguments as make_move.
+        """
+        return self._validate_move(move_from, move_to).__class__ is tuple
+
+    def make_trusted_move(self, move):
+        """
+        Plays a packed move that is already known to be legal (from generate_legal_moves(encoded=True) or from a batch
+        validation) without checking it again. Passing a move that isn't legal leaves the game in a broken state.
+        """
+        move_from = move & 63
+        move_to = (move >> 6) & 63
+        chess_piece = self._board.piece_at(move_from)
+        special = None
+        if self._castling_rights or self._promotion_targets is not None:
+            special = self._special_move(move_from, move_to, chess_piece, move >> 12)
+        self._play(move_from, move_to, chess_piece, self._board.piece_at(move_to), special)
+
+    def _validate_move(self, move_from, move_to):
+        """
+        Runs every check make_move does. Returns (from index, to index, chess piece, opposing piece or None, special)
+        for a legal move, or the reason (GAME_OVER, OUT_OF_BOUNDS, ...) of the first check it fails if it isn't legal.
+        special is None for an ordinary move, the Castle being played or the chess piece a pawn promotes to (see
+        _special_move).
+        """
+        # 0) check if game is still active
+        if self._game_state != "UNFINISHED":
+            return GAME_OVER
+
+        # 1) gather data - square names are only parsed here, everything after works on square indexes
+        flags = 0
+        if move_to is None:
+            if move_from.__class__ is not int:
+                return OUT_OF_BOUNDS
+            move_to = (move_from >> 6) & 63
+            flags = move_from >> 12
+            move_from &= 63
+        else:
+            move_from = square_to_index(move_from)
+            move_to = square_to_index(move_to)
 
         # 2) validate the move
         # - checking if coordinates are within bounds
-        if move_from not in self._board or move_to not in self._board:
-            return False
+        if move_from is None or move_to is None:
+            return OUT_OF_BOUNDS
 
         # - checking if position at move_from has a chess piece and whether it's that color's turn
-        chess_piece = self.get_piece_at(move_from)
-        if chess_piece is None or chess_piece.get_color() != self._turn:
-            return False
+        chess_piece = self._board.piece_at(move_from)
+        if chess_piece is None:
+            return EMPTY_SQUARE
+        if chess_piece.get_color() != self._turn:
+            return WRONG_TURN
+
+        # - castling and promotion only exist under variants that have them
+        special = None
+        if self._castling_rights or self._promotion_targets is not None:
+            special = self._special_move(move_from, move_to, chess_piece, flags)
+
+            # a castle is a king move the pieces' patterns don't know about, it only needs empty squares between
+            if special.__class__ is Castle:
+                if self._board.get_occupied() & special.path:
+                    return BAD_PATTERN
+                return move_from, move_to, chess_piece, None, special
 
         # - final check: checking to see if movement pattern is valid for that given chess piece
-        if not chess_piece.is_move_valid(move_from, move_to, self._board):
-            return False
+        if not self._board.is_move_valid(move_from, move_to):
+            return BAD_PATTERN
 
-        # 3) handle move: either an explosion will happen or the piece just made a simple move
-        opposing_piece = self.get_piece_at(move_to)
+        # - guard clause to prevent kings from exploding: a king can't initiate a capture
+        opposing_piece = self._board.piece_at(move_to)
+        if opposing_piece is not None and isinstance(chess_piece, King):
+            return KING_CAPTURE
 
-        # - there is an opposing piece and that chess piece is an opposite colors
-        if opposing_piece and opposing_piece.get_color() != self._turn:
-            # guard clause to prevent kings from exploding:
-            if isinstance(chess_piece, King):
-                return False
+        return move_from, move_to, chess_piece, opposing_piece, special
+
+    def _special_move(self, move_from, move_to, chess_piece, flags):
+        """
+        Tells castling and promotion apart from ordinary moves, from the variant's tables alone (legality is left to the
+        caller). Returns the Castle a king move plays while its castling right stands, the chess piece a pawn moving
+        onto an empty promotion square becomes (a queen unless the packed move's flags ask for another piece), or None.
+        """
+        code = chess_piece.get_code()
+
+        castle = self._castles.get(move_from | (move_to << 6))
+        if castle is not None and castle.king_code == code and self._castling_rights & castle.right:
+            return castle
+
+        # a capturing pawn is blown up with its victim, so only quiet moves promote
+        promotion_targets = self._promotion_targets
+        if (promotion_targets is not None and promotion_targets[code] & SQUARE_BITS[move_to]
+                and self._board.piece_at(move_to) is None):
+            return PIECES[code + (KNIGHT + (flags & 3) if flags & PROMOTION else QUEEN)]
+
+        return None
 
-            self._handle_explosion(move_from, move_to)  # explosion happened
+    def _play(self, move_from, move_to, chess_piece, opposing_piece, special=None):
+        """
+        Plays an already validated move given by square indexes: either an explosion will happen or the piece just
+        makes a simple move (or castles, or promotes, when special says so - see _validate_move). Then toggles the turn
+        and updates the game state.
+        """
+        castling_rights = self._castling_rights
+        undo_entry = (move_from, move_to, chess_piece, opposing_piece, self._white_king_pos, self._black_king_pos,
+                      self._turn, self._game_state, self._hash, castling_rights, special)
+
+        # - there is an opposing piece (always of the opposite color, the move was validated)
+        if opposing_piece is not None:
+            exploded_pieces = self._handle_explosion(move_from, move_to)  # explosion happened
+            self._history.append(undo_entry + (exploded_pieces,))
+            self._attacks_changed |= self._blast_masks[move_to] | SQUARE_BITS[move_to] | SQUARE_BITS[move_from]
+            if castling_rights:
+                for index, _ in exploded_pieces:
+                    castling_rights &= self._castling_masks[index]
+        elif special is not None:
+            self._history.append(undo_entry + ((),))
+            self._play_special(move_from, move_to, chess_piece, special)
         else:
-            self._board[move_from] = None
-            self._board[move_to] = chess_piece
-            chess_piece.set_position(move_to)
+            self._history.append(undo_entry + ((),))
+            self._attacks_changed |= SQUARE_BITS[move_to] | SQUARE_BITS[move_from]
+            self._board.set_piece(move_from, None)
+            self._board.set_piece(move_to, chess_piece)
+            code = chess_piece.get_code()
+            piece_keys = ZOBRIST_PIECES[code]
+            self._hash ^= piece_keys[move_from] ^ piece_keys[move_to]
+            self._evaluator.move(code, move_from, move_to)
             if isinstance(chess_piece, King):
                 self._update_king_position(chess_piece.get_color(), move_to)
 
-        # 4) toggle turn and update
+        # a king or rook leaving (or being blown off, or captured on) its square loses the castling rights it held
+        if self._castling_rights:
+            castling_rights &= self._castling_masks[move_from] & self._castling_masks[move_to]
+            if castling_rights != self._castling_rights:
+                self._hash ^= ZOBRIST_CASTLING[self._castling_rights] ^ ZOBRIST_CASTLING[castling_rights]
+                self._castling_rights = castling_rights
+
+        # toggle turn and update
         self._turn = "BLACK" if self._turn == "WHITE" else "WHITE"
+        self._hash ^= ZOBRIST_BLACK_TO_MOVE
         self._update_game_state()
 
-        # 5) confirm move
+    def unmake_move(self):
+        """
+        Takes back the last move made with make_move, including every chess piece its explosion removed, the king
+        positions, the turn and the game state. Only the squares the move changed are touched. Returns False if there
+        is no move to take back.
+        """
+        if not self._history:
+            return False
+
+        (move_from, move_to, chess_piece, opposing_piece, white_king_pos, black_king_pos, turn, game_state,
+         position_hash, castling_rights, special, exploded_pieces) = self._history.pop()
+
+        # putting back the pieces the explosion removed around the origin
+        board = self._board
+        evaluator = self._evaluator
+        for index, exploded_piece in exploded_pieces:
+            board.set_piece(index, exploded_piece)
+            evaluator.add(exploded_piece.get_code(), index)
+
+        # putting back the captured piece (or the empty square) and the piece that moved
+        board.set_piece(move_to, opposing_piece)
+        board.set_piece(move_from, chess_piece)
+        if special is not None:
+            self._unplay_special(move_from, move_to, chess_piece, special)
+        elif opposing_piece is None:
+            evaluator.move(chess_piece.get_code(), move_to, move_from)
+        else:
+            evaluator.add(opposing_piece.get_code(), move_to)
+            evaluator.add(chess_piece.get_code(), move_from)
+            self._attacks_changed |= self._blast_masks[move_to]
+        self._attacks_changed |= SQUARE_BITS[move_to] | SQUARE_BITS[move_from]
+
+        self._white_king_pos = white_king_pos
+        self._black_king_pos = black_king_pos
+        self._turn = turn
+        self._game_state = game_state
+        self._hash = position_hash
+        self._castling_rights = castling_rights
+
         return True
 
+    def _play_special(self, move_from, move_to, chess_piece, special):
+        """
+        Plays a castle or a promotion (see _special_move) - never a capture - keeping the hash and evaluation up to
+        date.
+        """
+        board = self._board
+        evaluator = self._evaluator
+        code = chess_piece.get_code()
+        board.set_piece(move_from, None)
+        self._attacks_changed |= SQUARE_BITS[move_to] | SQUARE_BITS[move_from]
+
+        if special.__class__ is Castle:
+            board.set_piece(move_to, chess_piece)
+            self._hash ^= ZOBRIST_PIECES[code][move_from] ^ ZOBRIST_PIECES[code][move_to]
+            evaluator.move(code, move_from, move_to)
+            self._update_king_position(chess_piece.get_color(), move_to)
+
+            # the rook jumps over to the other side of the king
+            rook_keys = ZOBRIST_PIECES[special.rook_code]
+            board.set_piece(special.rook_from, None)
+            board.set_piece(special.rook_to, PIECES[special.rook_code])
+            self._hash ^= rook_keys[special.rook_from] ^ rook_keys[special.rook_to]
+            evaluator.move(special.rook_code, special.rook_from, special.rook_to)
+            self._attacks_changed |= SQUARE_BITS[special.rook_from] | SQUARE_BITS[special.rook_to]
+        else:
+            promoted_code = special.get_code()
+            board.set_piece(move_to, special)
+            self._hash ^= ZOBRIST_PIECES[code][move_from] ^ ZOBRIST_PIECES[promoted_code][move_to]
+            evaluator.remove(code, move_from)
+            evaluator.add(promoted_code, move_to)
+
+    def _unplay_special(self, move_from, move_to, chess_piece, special):
+        """
+        Takes back the evaluation of a castle or promotion, and the rook of a castle, once unmake_move has put the
+        moving piece back. The hash and king positions are restored by unmake_move itself.
+        """
+        if special.__class__ is Castle:
+            self._evaluator.move(chess_piece.get_code(), move_to, move_from)
+            self._board.set_piece(special.rook_to, None)
+            self._board.set_piece(special.rook_from, PIECES[special.rook_code])
+            self._evaluator.move(special.rook_code, special.rook_to, special.rook_from)
+            self._attacks_changed |= SQUARE_BITS[special.rook_from] | SQUARE_BITS[special.rook_to]
+        else:
+            self._evaluator.remove(special.get_code(), move_to)
+            self._evaluator.add(chess_piece.get_code(), move_from)
+
+    def get_exploded_squares(self):
+        """
+        Returns the square names cleared by the explosion of the last move made (the capture square first, then the
+        capturing piece's square, then every piece removed around the blast), or an empty tuple if the last move was
+        not a capture.
+        """
+        if not self._history:
+            return ()
+
+        move_from, move_to, _, opposing_piece = self._history[-1][:4]
+        if opposing_piece is None:
+            return ()
+
+        exploded_squares = [move_to, move_from] + [index for index, _ in self._history[-1][-1]]
+        return tuple(SQUARE_NAMES[index] for index in exploded_squares)
+
+    def get_changed_squares(self):
+        """
+        Returns the square indexes the last move made changed: the square it left and the square it landed on, then
+        every square its explosion cleared (or the two squares of a castling rook). Empty if no move has been made.
+        """
+        if not self._history:
+            return ()
+
+        move_from, move_to = self._history[-1][:2]
+        special = self._history[-1][-2]
+        if special.__class__ is Castle:
+            return move_from, move_to, special.rook_from, special.rook_to
+        return (move_from, move_to) + tuple(index for index, _ in self._history[-1][-1])
+
+    def get_turn(self):
+        """
+        Returns the player whose turn it is ("WHITE" or "BLACK").
+        """
+        return self._turn
+
+    def get_bitboards(self):
+        """
+        Returns (piece bitboards, color bitboards) of the current position. Piece bitboards are indexed by piece code
+        (see Piece.get_code) and color bitboards by 0 for white and 1 for black. Treat them as read-only.
+        """
+        return self._board.get_bitboards()
+
+    def evaluate(self):
+        """
+        Returns the evaluation of the current position (material plus piece-square bonuses, in centipawns) from the
+        point of view of the player to move. Kept up to date move by move, so this doesn't look at the board.
+        """
+        return self._evaluator.evaluate(self._turn == "BLACK")
+
+    def material(self):
+        """
+        Returns the material (in centipawns, kings excluded) each side has left as a (white, black) tuple.
+        """
+        return self._evaluator.material()
+
+    def get_evaluator(self):
+        """
+        Returns the Evaluator tracking this game, which also holds piece counts per piece code. Treat it as read-only.
+        """
+        return self._evaluator
+
+    def get_piece_squares(self, code):
+        """
+        Returns the square indexes holding a piece code (color * 6 + kind), lowest first, read off the board's
+        bitboard for that code.
+        """
+        return squares_of(self._board.get_bitboards()[0][code])
+
+    def get_position_hash(self):
+        """
+        Returns the 64-bit Zobrist hash of the current position (chess pieces on the board and the player to move).
+        Two positions with the same hash can be treated as the same position.
+        """
+        return self._hash
+
+    def _create_evaluator(self):
+        """
+        Builds an Evaluator for the current board from scratch. make_move keeps it up to date incrementally, so this is
+        only needed when a board is set up.
+        """
+        evaluator = Evaluator()
+        for index in range(64):
+            chess_piece = self._board.piece_at(index)
+            if chess_piece is not None:
+                evaluator.add(chess_piece.get_code(), index)
+        return evaluator
+
+    def _compute_hash(self):
+        """
+        Computes the Zobrist hash of the current position from scratch. make_move keeps it up to date incrementally, so
+        this is only needed when a board is set up.
+        """
+        position_hash = ZOBRIST_BLACK_TO_MOVE if self._turn == "BLACK" else 0
+        position_hash ^= ZOBRIST_CASTLING[self._castling_rights]
+        for index in range(64):
+            chess_piece = self._board.piece_at(index)
+            if chess_piece is not None:
+                position_hash ^= ZOBRIST_PIECES[chess_piece.get_code()][index]
+        return position_hash
+
+    def generate_legal_moves(self, encoded=False):
+        """
+        Returns a list of every legal move for the player whose turn it is. By default each move is a (move_from,
+        move_to) pair of square names; with encoded=True each move is a packed 16-bit move (see moves.encode_move) with
+        the CAPTURE or DOUBLE_PAWN_PUSH flag set where it applies (and the castling or promotion flags, under a variant
+        that has them). Either form can be passed straight to make_move. The same rules make_move enforces apply: only
+        the side to move, no landing on your own chess pieces, and kings cannot initiate a capture. Returns an empty
+        list once the game is over.
+        """
+        if self._game_state != "UNFINISHED":
+            return []
+
+        if encoded:
+            return self._generate_moves()
+
+        # a pair of squares can only ask for a queen, so under-promotions are left out of this form
+        moves = self._generate_moves()
+        if self._promotion_targets is not None:
+            moves = [move for move in moves if not move >> 12 & PROMOTION or move >> 12 == QUEEN_PROMOTION]
+        return [(SQUARE_NAMES[move & 63], SQUARE_NAMES[(move >> 6) & 63]) for move in moves]
+
+    def get_book_moves(self, book, encoded=False):
+        """
+        Returns the moves an opening book (see book.OpeningBook) has for the current position, most played first, in
+        the same form as generate_legal_moves. Returns an empty list once the position is out of book.
+        """
+        moves = [move for move, _ in book.lookup(self._hash) if self.is_move_legal(move)]
+        return moves if encoded else [move_to_squares(move) for move in moves]
+
+    def _generate_moves(self):
+        """
+        Generates the legal moves of the side to move as packed 16-bit moves using the precomputed attack tables
+        (knight, king, pawn) and ray tables (rook, bishop, queen), plus the variant's castles and promotions.
+        """
+        pieces, colors = self._board.get_bitboards()
+        color = COLOR_INDEX[self._turn]
+        own = colors[color]
+        enemy = colors[1 - color]
+        occupied = own | enemy
+        empty = ~occupied
+        base = color * 6
+        add_moves = self._add_moves
+        moves = []
+
+        # 1) pawns - pushes onto empty squares and diagonal captures of enemy pieces
+        pushes = PAWN_PUSHES[color]
+        double_pushes = PAWN_DOUBLE_PUSHES[color]
+        pawn_attacks = PAWN_ATTACKS[color]
+        promotion_rank = self._promotion_targets[base + PAWN] if self._promotion_targets is not None else 0
+        bitboard = pieces[base + PAWN]
+        while bitboard:
+            low_bit = bitboard & -bitboard
+            bitboard ^= low_bit
+            move_from = low_bit.bit_length() - 1
+
+            add_moves(moves, move_from, pawn_attacks[move_from] & enemy, CAPTURE)
+            push = pushes[move_from] & empty
+            if push & promotion_rank:
+                for promotion in range(QUEEN_PROMOTION, PROMOTION - 1, -1):
+                    add_moves(moves, move_from, push, promotion)
+            elif push:
+                add_moves(moves, move_from, push, QUIET)
+                add_moves(moves, move_from, double_pushes[move_from] & empty, DOUBLE_PAWN_PUSH)
+
+        # 2) knights and the king jump straight to their targets - the king may not capture, so it only gets empty
+        # squares
+        bitboard = pieces[base + KNIGHT]
+        while bitboard:
+            low_bit = bitboard & -bitboard
+            bitboard ^= low_bit
+            move_from = low_bit.bit_length() - 1
+            add_moves(moves, move_from, KNIGHT_ATTACKS[move_from] & enemy, CAPTURE)
+            add_moves(moves, move_from, KNIGHT_ATTACKS[move_from] & empty, QUIET)
+
+        bitboard = pieces[base + KING]
+        while bitboard:
+            low_bit = bitboard & -bitboard
+            bitboard ^= low_bit
+            move_from = low_bit.bit_length() - 1
+            add_moves(moves, move_from, KING_ATTACKS[move_from] & empty, QUIET)
+
+        # castling, while the rights stand and the squares between king and rook are empty
+        if self._castling_rights:
+            for castle in self._variant.get_castles_by_color()[color]:
+                if self._castling_rights & castle.right and not occupied & castle.path:
+                    moves.append(castle.move)
+
+        # 3) sliding pieces follow their rays up to (and including) the first blocker
+        for kind, attacks in ((BISHOP, bishop_attacks), (ROOK, rook_attacks), (QUEEN, queen_attacks)):
+            bitboard = pieces[base + kind]
+            while bitboard:
+                low_bit = bitboard & -bitboard
+                bitboard ^= low_bit
+                move_from = low_bit.bit_length() - 1
+                targets = attacks(move_from, occupied)
+                add_moves(moves, move_from, targets & enemy, CAPTURE)
+                add_moves(moves, move_from, targets & empty, QUIET)
+
+        return moves
+
+    @staticmethod
+    def _add_moves(moves, move_from, targets, flags):
+        """
+        Appends a packed move from move_from, with the given flags, for every square set in the targets bitboard.
+        """
+        move_base = move_from | (flags << 12)
+        while targets:
+            low_bit = targets & -targets
+            targets ^= low_bit
+            moves.append(move_base | ((low_bit.bit_length() - 1) << 6))
+
+    def _get_attack_maps(self):
+        """
+        Returns the AttackMaps of the current position, bringing them up to date with the squares changed since the
+        last query.
+        """
+        if self._attack_maps is None:
+            self._attack_maps = AttackMaps(self._board)
+        elif self._attacks_changed:
+            self._attack_maps.update(self._board, self._attacks_changed)
+        self._attacks_changed = 0
+        return self._attack_maps
+
+    @staticmethod
+    def _square_index(square):
+        """
+        Converts a square name or index to its index, raising KeyError if it isn't on the board.
+        """
+        index = square_to_index(square)
+        if index is None:
+            raise KeyError(square)
+        return index
+
+    def get_attack_map(self, color):
+        """
+        Returns the bitboard of squares a player ("WHITE" or "BLACK") attacks, meaning an opposing chess piece standing
+        there could be captured. Kings attack nothing since they can't capture.
+        """
+        return self._get_attack_maps().get_attack_map(self._board, COLOR_INDEX[color])
+
+    def is_attacked(self, square, by_color):
+        """
+        Returns True if the player by_color ("WHITE" or "BLACK") attacks a square, given as a name or index.
+        """
+        return self._get_attack_maps().is_attacked(self._board, self._square_index(square), COLOR_INDEX[by_color])
+
+    def attackers_of(self, square, by_color):
+        """
+        Returns the square names of the chess pieces of by_color ("WHITE" or "BLACK") that attack a square.
+        """
+        attackers = self._get_attack_maps().attackers_of(self._board, self._square_index(square), COLOR_INDEX[by_color])
+        return tuple(SQUARE_NAMES[index] for index in attackers)
+
+    def capture_blast_victims(self, move_from, move_to):
+        """
+        Returns the square names of every chess piece a capture from move_from on move_to would remove: the captured
+        piece, the capturing piece and the non-pawn pieces around the blast - including a king, which is how to tell
+        whether a capture would blow up your own king. Returns an empty tuple if there is nothing to capture on
+        move_to. The capture itself isn't checked for legality.
+        """
+        move_from = self._square_index(move_from)
+        move_to = self._square_index(move_to)
+        if self._board.piece_at(move_to) is None:
+            return ()
+
+        victims = [move_to, move_from]
+        victims.extend(index for index in self._board.get_blast_victims(move_to, self._blast_masks, self._immune_codes)
+                       if index != move_from)
+        return tuple(SQUARE_NAMES[index] for index in victims)
+
     def get_piece_at(self, position):
         """
-        Returns the chess piece at a given position. Will return None if there are no pieces at that position.
+        Returns the chess piece at a given position, given as a square name ("e4") or index (0-63). Will return None if
+        there are no pieces at that position.
         """
-        return self._board[f"{position.lower()}"]
+        return self._board.piece_at(self._square_index(position))
 
     def _update_game_state(self):
         """
         Updates the game state to one of these conditions: "UNFINISHED", "WHITE_WON", or "BLACK_WON"
         """
-        is_white_king_alive = isinstance(self.get_piece_at(self._white_king_pos), King)
-        is_black_king_alive = isinstance(self.get_piece_at(self._black_king_pos), King)
+        is_white_king_alive = self._board.piece_at(self._white_king_pos) is PIECES[KING]
+        is_black_king_alive = self._board.piece_at(self._black_king_pos) is PIECES[6 + KING]
 
         if not is_white_king_alive:
             self._game_state = "BLACK_WON"
@@ -163,10 +781,8 @@ class ChessVar:
 
     def _update_king_position(self, color, new_position):
         """
-        Updates the position of a given King
+        Updates the position (square index) of a given King
         """
-        new_position.lower()
-
         if color == "WHITE":
             self._white_king_pos = new_position
         else:
@@ -174,45 +790,55 @@ class ChessVar:
 
     def _handle_explosion(self, move_from, explosion_origin):
         """
-        This function explodes the captured and the capturee, as well as the 8 squares around the capture origin. Pawns
-        are not affected by the explosion radius, unless they were involved in the capture.
+        This function explodes the captured and the capturee, as well as the squares around the capture origin (the 8
+        neighbours under the standard rules, the variant's blast radius otherwise). Pawns - or the variant's immune
+        pieces - are not affected by the explosion radius, unless they were involved in the capture. Returns the
+        (square index, chess piece) pairs removed around the origin so the move can be undone.
         """
-        origin_letter, origin_number = explosion_origin
-        exploded_squares = []
-
-        # iterating over the 3x3 area and adding that square's key to the exploded_squares list
-        for x in range(-1, 2):
-            for y in range(-1, 2):
-                if (x, y) != (0,0):
-                    new_letter = chr(ord(origin_letter) + x)
-                    new_number = str(int(origin_number) + y)
-                    key = new_letter + new_number
-                    if key in self._board:
-                        exploded_squares.append(key)
-
-        # removing the 8 squares around the origin (unless it's a pawn)
-        for key in exploded_squares:
-            chess_piece = self.get_piece_at(key)
-            if chess_piece and not isinstance(chess_piece, Pawn):
-                self._board[key] = None
+        board = self._board
+
+        evaluator = self._evaluator
+
+        # removing every piece the precomputed blast reaches (immune pieces are filtered out by the board) - remembering
+        # them so the move can be undone. The initiator is left to the step below even when it stands inside the blast,
+        # so the undo entry already holds it
+        exploded_pieces = []
+        for index in board.get_blast_victims(explosion_origin, self._blast_masks, self._immune_codes):
+            if index == move_from:
+                continue
+            chess_piece = board.piece_at(index)
+            code = chess_piece.get_code()
+            board.set_piece(index, None)
+            exploded_pieces.append((index, chess_piece))
+            self._hash ^= ZOBRIST_PIECES[code][index]
+            evaluator.remove(code, index)
 
         # removing initiator and enemy's chess piece
-        self._board[move_from] = None
-        self._board[explosion_origin] = None
+        for index in (move_from, explosion_origin):
+            code = board.piece_at(index).get_code()
+            self._hash ^= ZOBRIST_PIECES[code][index]
+            evaluator.remove(code, index)
+            board.set_piece(index, None)
+
+        return exploded_pieces
 
 
 class Piece:
     """
     This class represent a generic chess piece. These private base data members will be shared with more specific chess
-    pieces like king, queen, and pawn for instance.
+    pieces like king, queen, and pawn for instance. A chess piece doesn't know where it stands - the board does - so one
+    shared (flyweight) instance per type and color is enough for every game (see PIECES).
     """
-    def __init__(self, color, position):
+    __slots__ = ("_color", "_code")
+
+    def __init__(self, color, position=None):
         """
         Constructor for the Piece class. This will instantiate the following private data members: color (the color
-        of a given chess piece) and a position (the chess piece's position on the chess board)
+        of a given chess piece) and code (see get_code). position is still accepted for backwards compatibility but
+        isn't stored.
         """
         self._color = color.upper()
-        self._position = position.lower()
+        self._code = self._kind + 6 * COLOR_INDEX[self._color]
 
     def get_color(self):
         """
@@ -220,11 +846,12 @@ class Piece:
         """
         return self._color
 
-    def set_position(self, new_pos):
+    def get_code(self):
         """
-        Updates the old position to a new position for a chess piece.
+        Returns the piece code used by the bitboard engine: 0-5 for white pieces and 6-11 for black pieces, in the
+        order pawn, knight, bishop, rook, queen, king.
         """
-        self._position = new_pos.lower()
+        return self._code
 
     def get_ascii_art(self):
         """
@@ -234,19 +861,90 @@ class Piece:
 
     def is_move_valid(self, move_from, move_to, board):
         """
-        Returns a boolean that tells whether a move from move_from to move_to is valid. This function should be
-        overridden.If it isn't, the function should return the built-in "NotImplementedError" exception.
+        Returns a boolean that tells whether a move from move_from to move_to is valid. The squares can be names ("e4")
+        or indexes (0-63). This function should be overridden.If it isn't, the function should return the built-in
+        "NotImplementedError" exception.
         """
         raise NotImplementedError("You forgot to implement the 'is_move_valid' function")
 
+    def _can_land_on(self, destination_piece):
+        """
+        Returns True if the destination square is clear or belongs to the opposing enemy's chess piece.
+        """
+        return destination_piece is None or destination_piece.get_color() != self._color
+
+
+def _piece_lookup(board):
+    """
+    Returns a function that looks up the chess piece at a square index of board. The board engines answer by index
+    directly; a plain dictionary keyed by square names is looked up by name.
+    """
+    piece_at = getattr(board, "piece_at", None)
+    if piece_at is not None:
+        return piece_at
+    return lambda index: board.get(SQUARE_NAMES[index])
+
+
+def _occupancy(board):
+    """
+    Returns the occupancy bitboard of board. The board engines keep one; for a plain dictionary keyed by square names it
+    is built by scanning the squares.
+    """
+    get_occupied = getattr(board, "get_occupied", None)
+    if get_occupied is not None:
+        return get_occupied()
+
+    occupied = 0
+    for index, name in enumerate(SQUARE_NAMES):
+        if board.get(name) is not None:
+            occupied |= SQUARE_BITS[index]
+    return occupied
+
+
+class SlidingPiece(Piece):
+    """
+    Shared move check of the Rook, Bishop and Queen. No path is ever walked square by square: whether a square is on
+    the piece's lines and whether the path to it is clear are single mask tests (see tables.BETWEEN), and the squares
+    it reaches come from the occupancy-indexed line tables of tables.py. Subclasses set _lines to the lines they slide
+    along and _attacks to the matching attack function.
+    """
+    __slots__ = ()
+    _lines = None
+    _attacks = None
+
+    def get_attacks(self, move_from, board):
+        """
+        Returns the bitboard of squares this chess piece attacks from move_from (a name or index) on board: every square
+        it can slide to, up to and including the first chess piece in each direction, whatever its color.
+        """
+        return self._attacks(square_to_index(move_from), _occupancy(board))
+
+    def is_move_valid(self, move_from, move_to, board):
+        """
+        Returns a boolean that tells whether a move from move_from to move_to is valid.
+        """
+        # converting the squares to indexes (names are only parsed here, at the edge)
+        move_from = square_to_index(move_from)
+        move_to = square_to_index(move_to)
+        if move_from is None or move_to is None:
+            return False
+
+        # the destination has to be on one of the piece's lines with nothing in between (a single mask test each), and
+        # be clear or belong to the opposing enemy's chess piece
+        if not self._lines[move_from] & SQUARE_BITS[move_to] or _occupancy(board) & BETWEEN[move_from][move_to]:
+            return False
+        return self._can_land_on(_piece_lookup(board)(move_to))
+
 
 class King(Piece):
     """
     This class represents the King chess piece.
     Inherited att:
     self._color - the color of the King chess piece
-    self._position - the position of the King on the board
+    self._code - the piece code of the King (see Piece.get_code)
     """
+    __slots__ = ()
+    _kind = KING
 
     def get_ascii_art(self):
         """
@@ -261,38 +959,35 @@ class King(Piece):
         """
         Returns a boolean that tells whether a move from move_from to move_to is valid.
         """
-        # destructuring the data to make it easier to work with
-        old_letter, old_number = move_from
-        new_letter, new_number = move_to
-
-        # refining the data to make it easier to work with
-        old_number = int(old_number)
-        new_number = int(new_number)
-        old_unicode = ord(old_letter)
-        new_unicode = ord(new_letter)
+        # converting the squares to indexes (names are only parsed here, at the edge)
+        move_from = square_to_index(move_from)
+        move_to = square_to_index(move_to)
+        if move_from is None or move_to is None:
+            return False
 
         # finding acceptable movement
-        x_direction = abs(new_unicode - old_unicode)
-        y_direction = abs(new_number - old_number)
+        x_direction = abs(FILE_OF[move_to] - FILE_OF[move_from])
+        y_direction = abs(RANK_OF[move_to] - RANK_OF[move_from])
 
-        # checking to see if the movement is one square in any direction
+        # checking to see if the movement is one square in any direction, then making sure that the destination is
+        # clear or belongs to opposing enemy's chess piece
         if x_direction <= 1 and y_direction <= 1:
-
-            # finally checking to make sure that the destination is clear or belongs to opposing enemy's chess piece
-            destination_piece = board.get(move_to)
-            if destination_piece is None or destination_piece.get_color() != self._color:
-                return True
+            return self._can_land_on(_piece_lookup(board)(move_to))
 
         return False
 
 
-class Queen(Piece):
+class Queen(SlidingPiece):
     """
     This class represents the Queen chess piece.
     Inherited att:
     self._color - the color of the Queen chess piece
-    self._position - the position of the Queen on the board
+    self._code - the piece code of the Queen (see Piece.get_code)
     """
+    __slots__ = ()
+    _kind = QUEEN
+    _lines = QUEEN_LINES
+    _attacks = staticmethod(queen_attacks)
 
     def get_ascii_art(self):
         """
@@ -303,68 +998,18 @@ class Queen(Piece):
         else:
             return "♕"
 
-    def is_move_valid(self, move_from, move_to, board):
-        """
-        Returns a boolean that tells whether a move from move_from to move_to is valid.
-        """
-        # destructuring the data to make it easier to work with
-        old_letter, old_number = move_from
-        new_letter, new_number = move_to
-
-        # refining the data to make it easier to work with
-        old_number = int(old_number)
-        new_number = int(new_number)
-        old_unicode = ord(old_letter)
-        new_unicode = ord(new_letter)
-
-        # finding acceptable movement
-        x_direction = abs(new_unicode - old_unicode)
-        y_direction = abs(new_number - old_number)
-
-        # checking to make sure that path is clear:
-
-        # 1) checking for diagonal movement - logic from bishop
-        if x_direction == y_direction:
-            file_step = 1 if new_unicode > old_unicode else -1
-            rank_step = 1 if new_number > old_number else -1
-            for i in range(1, x_direction):
-                intermediate_file = chr(old_unicode + i * file_step)
-                intermediate_rank = old_number + i * rank_step
-                if board[f"{intermediate_file}{intermediate_rank}"] is not None:
-                    return False
-
-        # 2) checking for vertical movement - logic from rook
-        elif old_letter == new_letter:
-            step = 1 if new_number > old_number else -1
-            for num in range(old_number + step, new_number, step):
-                if board[f"{old_letter}{num}"] is not None:
-                    return False
-
-        # 3) checking for horizontal movement - logic from rook
-        elif old_number == new_number:
-            step = 1 if new_unicode > old_unicode else -1
-            for unicode_val in range(old_unicode + step, new_unicode, step):
-                letter = chr(unicode_val)
-                if board[f"{letter}{old_number}"] is not None:
-                    return False
-        else:
-            return False
-
-        # finally checking to make sure that the destination square is clear or belongs to opposing enemy's chess piece
-        destination_piece = board.get(move_to)
-        if destination_piece is None or destination_piece.get_color() != self._color:
-            return True
-
-        return False
-
 
-class Bishop(Piece):
+class Bishop(SlidingPiece):
     """
     This class represents the Bishop chess piece.
         Inherited att:
     self._color - the color of the Bishop chess piece
-    self._position - the position of the Bishop on the board
+    self._code - the piece code of the Bishop (see Piece.get_code)
     """
+    __slots__ = ()
+    _kind = BISHOP
+    _lines = BISHOP_LINES
+    _attacks = staticmethod(bishop_attacks)
 
     def get_ascii_art(self):
         """
@@ -375,56 +1020,16 @@ class Bishop(Piece):
         else:
             return "♗"
 
-    def is_move_valid(self, move_from, move_to, board):
-        """
-        Returns a boolean that tells whether a move from move_from to move_to is valid.
-        """
-
-        # destructuring the data to make it easier to work with
-        old_letter, old_number = move_from
-        new_letter, new_number = move_to
-
-        # refining the data to make it easier to work with
-        old_number = int(old_number)
-        new_number = int(new_number)
-        old_unicode = ord(old_letter)
-        new_unicode = ord(new_letter)
-
-        # finding acceptable movement
-        x_direction = abs(new_unicode - old_unicode)
-        y_direction = abs(new_number - old_number)
-
-        # bishops only move diagonally
-        if old_letter != new_letter and old_number != new_number:
-
-            # finding the step direction for the letter(x-axis) or number(y-axis)
-            letter_step = 1 if new_unicode > old_unicode else -1
-            number_step = 1 if new_number > old_number else -1
-
-            # check each square along the path for any other pieces
-            for i in range(1, x_direction):
-                # forming the proper key
-                key_letter = chr(old_unicode + i * letter_step)
-                key_number = old_number + i * number_step
-                # checking to see if square is skip-able
-                if board[f"{key_letter}{key_number}"] is not None:
-                    return False
-
-            # finally checking the destination square
-            destination_piece = board.get(move_to)
-            if destination_piece is None or destination_piece.get_color() != self._color:
-                return True
-
-        return False
-
 
 class Knight(Piece):
     """
     This class represents the Knight chess piece.
     Inherited att:
     self._color - the color of the Knight chess piece
-    self._position - the position of the Knight on the board
+    self._code - the piece code of the Knight (see Piece.get_code)
     """
+    __slots__ = ()
+    _kind = KNIGHT
 
     def get_ascii_art(self):
         """
@@ -439,35 +1044,34 @@ class Knight(Piece):
         """
         Returns a boolean that tells whether a move from move_from to move_to is valid.
         """
-        # destructuring the data to make it easier to work with
-        old_letter, old_number = move_from
-        new_letter, new_number = move_to
-
-        # refining the data to make it easier to work with
-        old_number = int(old_number)
-        new_number = int(new_number)
-        old_unicode = ord(old_letter)
-        new_unicode = ord(new_letter)
+        # converting the squares to indexes (names are only parsed here, at the edge)
+        move_from = square_to_index(move_from)
+        move_to = square_to_index(move_to)
+        if move_from is None or move_to is None:
+            return False
 
         # finding acceptable movement
-        x_direction = abs(new_unicode - old_unicode)
-        y_direction = abs(new_number - old_number)
+        x_direction = abs(FILE_OF[move_to] - FILE_OF[move_from])
+        y_direction = abs(RANK_OF[move_to] - RANK_OF[move_from])
 
         if (x_direction == 1 and y_direction == 2) or (x_direction == 2 and y_direction == 1):
             # checking to see if destination place is empty or if it's occupied by enemy chess piece
-            if board.get(move_to) is None or board.get(move_to).get_color() != self._color:
-                return True
+            return self._can_land_on(_piece_lookup(board)(move_to))
 
         return False
 
 
-class Rook(Piece):
+class Rook(SlidingPiece):
     """
     This class represents the Rook chess piece.
     Inherited att:
     self._color - the color of the Rook chess piece
-    self._position - the position of the Rook on the board
+    self._code - the piece code of the Rook (see Piece.get_code)
     """
+    __slots__ = ()
+    _kind = ROOK
+    _lines = ROOK_LINES
+    _attacks = staticmethod(rook_attacks)
 
     def get_ascii_art(self):
         """
@@ -478,65 +1082,17 @@ class Rook(Piece):
         else:
             return "♖"
 
-    def is_move_valid(self, move_from, move_to, board):
-        """
-        Returns a boolean that tells whether a move from move_from to move_to is valid.
-        """
-        # destructuring the data to make it easier to work with
-        old_letter, old_number = move_from
-        new_letter, new_number = move_to
-
-        # refining the data to make it easier to work with
-        old_number = int(old_number)
-        new_number = int(new_number)
-        old_unicode = ord(old_letter)
-        new_unicode = ord(new_letter)
-
-        # making sure that the Rook is NOT traveling diagonally
-        if old_letter != new_letter and old_number != new_number:
-            return False
-
-        # iterating over the movement path, checking to see if path is clear:
-
-        # - vertical:
-        if old_letter == new_letter:
-            step = 1 if new_number > old_number else -1
-
-            # iterating vertically - direction depends on step value
-            # 1 means up, -1 means down
-            for num in range(old_number + step, new_number, step):
-                if board[f"{old_letter}{num}"] is not None:
-                    return False
-
-        # - horizontal:
-        else:
-            step = 1 if new_unicode > old_unicode else -1
-
-            # iterating horizontally via unicode - direction depends on step value
-            # 1 means right, -1 means left
-            for unicode_val in range(old_unicode + step, new_unicode, step):
-                # reverting unicode back to a letter to create the proper key
-                letter = chr(unicode_val)
-
-                if board[f"{letter}{old_number}"] is not None:
-                    return False
-
-        # iteration ends just before the destination to handle the final edge case properly
-        destination_piece = board[move_to]
-
-        if destination_piece is not None and destination_piece.get_color() == self._color:
-            return False
-
-        return True
-
 
 class Pawn(Piece):
     """
     This class represents the Pawn chess piece.
     Inherited att:
     self._color - the color of the Pawn chess piece
-    self._position - the position of the Pawn on the board
+    self._code - the piece code of the Pawn (see Piece.get_code)
     """
+    __slots__ = ()
+    _kind = PAWN
+
     def get_ascii_art(self):
         """
         Returns the ascii art associated with that specific chess piece and color.
@@ -550,42 +1106,45 @@ class Pawn(Piece):
         """
         Returns a boolean that tells whether a move from move_from to move_to is valid.
         """
-        # destructuring the data to make it easier to work with
-        old_letter, old_number = move_from
-        new_letter, new_number = move_to
-
-        # refining the data to make it easier to work with
-        old_number = int(old_number)
-        new_number = int(new_number)
-        old_unicode = ord(old_letter)
-        new_unicode = ord(new_letter)
+        # converting the squares to indexes (names are only parsed here, at the edge)
+        move_from = square_to_index(move_from)
+        move_to = square_to_index(move_to)
+        if move_from is None or move_to is None:
+            return False
 
         # finding acceptable x and y directions the chess piece plans to move
-        x_direction = abs(old_unicode - new_unicode)
+        x_direction = abs(FILE_OF[move_to] - FILE_OF[move_from])
         y_dist = 1 if self._color == "WHITE" else -1
-        y_direction = old_number + y_dist
+        rank_diff = RANK_OF[move_to] - RANK_OF[move_from]
+        piece_at = _piece_lookup(board)
+        destination_piece = piece_at(move_to)
 
         # checks if pawn is moving vertically to a square that has no chess piece
-        if x_direction == 0 and y_direction == new_number and board[move_to] is None:
+        if x_direction == 0 and rank_diff == y_dist and destination_piece is None:
             return True
 
         # checking if pawn is moving two squares forward from its starting position, while also making sure that there
         # are no chess pieces in the square that's being skipped
-        starting_rank = 2 if self._color == "WHITE" else 7
-        if x_direction == 0 and old_number == starting_rank and new_number == old_number + 2 * y_dist:
-            skipped_square = old_letter + str(old_number + y_dist)
-            if board[move_to] is None and board[skipped_square] is None:
+        starting_rank = 1 if self._color == "WHITE" else 6
+        if x_direction == 0 and RANK_OF[move_from] == starting_rank and rank_diff == 2 * y_dist:
+            skipped_square = move_from + 8 * y_dist
+            if destination_piece is None and piece_at(skipped_square) is None:
                 return True
 
         # checks if pawn is performing a diagonal capture
-        if x_direction == 1 and y_direction == new_number:
+        if x_direction == 1 and rank_diff == y_dist:
             # double-checking to see if the diagonal piece belongs to enemy color
-            if board[move_to] is not None and board[move_to].get_color() != self._color:
+            if destination_piece is not None and destination_piece.get_color() != self._color:
                 return True
 
         return False
 
 
+# the shared chess pieces, indexed by piece code: white pawn, knight, bishop, rook, queen, king, then the black ones
+PIECES = tuple(piece_class(color) for color in ("white", "black")
+               for piece_class in (Pawn, Knight, Bishop, Rook, Queen, King))
+
+
 def main():
     """
     Testing the functions and classes
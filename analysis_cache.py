@@ -0,0 +1,166 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Process-wide cache of position analysis (legal moves, game state, search results) keyed by position
+# identity: the Zobrist hash of the position plus the key of the rules it is played under, so the same board under
+# different rules never shares an entry. Entries are evicted least recently used first once the cache outgrows its
+# memory budget. Every operation takes the cache's lock, so one cache can be shared by all threads of a process.
+
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+from search import SearchEngine
+
+# statistics returned by AnalysisCache.get_stats
+CacheStats = namedtuple("CacheStats", ["entries", "bytes", "max_bytes", "hits", "misses", "evictions"])
+
+# rough bookkeeping cost of one entry on top of its value: the key tuple and the ordered dictionary slot
+ENTRY_OVERHEAD = 200
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def _sizeof(value):
+    """
+    Estimates the memory a cached value holds, following tuples and lists (namedtuples included) one level at a
+    time.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(_sizeof(item) for item in value)
+    return size
+
+
+class AnalysisCache:
+    """
+    Thread-safe LRU cache of analysis results.
+    Data members:
+    self._entries - ordered dictionary key -> (value, size), least recently used first
+    self._max_bytes - memory budget of the cache
+    self._bytes - estimated memory held by the entries
+    self._lock - guards every member, held only while the dictionary is read or changed
+    """
+
+    def __init__(self, max_bytes=64 << 20):
+        """
+        Creates an empty cache holding at most about max_bytes of results.
+        """
+        if max_bytes < 1:
+            raise ValueError("An analysis cache needs a positive memory budget")
+
+        self._entries = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(game, kind, *params):
+        """
+        Returns the cache key of one kind of result ("moves", "state", "search", ...) for the current position of a
+        game, with any parameters the result depends on.
+        """
+        return game.get_position_hash(), game.get_rules_key(), kind, params
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached under key (marking it as recently used), or default.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Caches value under key, evicting the least recently used entries while the cache is over budget. Values are
+        shared between callers, so only cache immutable ones (tuples, namedtuples, strings, numbers).
+        """
+        size = _sizeof(value) + ENTRY_OVERHEAD
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._bytes -= old_entry[1]
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while self._bytes > self._max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the value cached under key, or calls compute(), caches its result and returns it. compute runs
+        without the lock held, so two threads missing on the same key at once may both compute it.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def legal_moves(self, game, encoded=False):
+        """
+        Cached generate_legal_moves: returns the legal moves of the current position as a tuple.
+        """
+        return self.get_or_compute(self.make_key(game, "moves", encoded),
+                                   lambda: tuple(game.generate_legal_moves(encoded)))
+
+    def game_state(self, game):
+        """
+        Cached get_game_state.
+        """
+        return self.get_or_compute(self.make_key(game, "state"), game.get_game_state)
+
+    def search(self, game, max_depth=4, node_limit=None):
+        """
+        Cached search: returns the SearchResult of searching the current position to max_depth (and at most node_limit
+        nodes). Only fixed-depth or node-bounded searches are cached, since they give the same answer every time.
+        """
+        return self.get_or_compute(self.make_key(game, "search", max_depth, node_limit),
+                                   lambda: SearchEngine().search(game, max_depth=max_depth, node_limit=node_limit))
+
+    def clear(self):
+        """
+        Removes every entry and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_stats(self):
+        """
+        Returns a CacheStats snapshot.
+        """
+        with self._lock:
+            return CacheStats(len(self._entries), self._bytes, self._max_bytes, self._hits, self._misses,
+                              self._evictions)
+
+
+def get_shared_cache():
+    """
+    Returns the process-wide AnalysisCache, creating it on first use.
+    """
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = AnalysisCache()
+        return _shared_cache
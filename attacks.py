@@ -0,0 +1,109 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Attack maps for atomic chess. AttackMaps keeps, for every square, the squares the piece standing on it
+# could capture on, and from those the union per side. After a move only the squares that changed are recomputed,
+# along with the sliding pieces whose rays reached one of them, since every other piece still sees the same board.
+# Kings never appear in the maps: in atomic chess a king can't capture, so it attacks nothing.
+
+from tables import (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, SQUARE_BITS, KNIGHT_ATTACKS, PAWN_ATTACKS, squares_of,
+                    rook_attacks, bishop_attacks, queen_attacks)
+
+
+def piece_attacks(code, index, occupied):
+    """
+    Returns the bitboard of squares a piece code standing on index could capture on, given the occupied squares.
+    """
+    kind = code % 6
+    if kind == PAWN:
+        return PAWN_ATTACKS[code // 6][index]
+    if kind == KNIGHT:
+        return KNIGHT_ATTACKS[index]
+    if kind == BISHOP:
+        return bishop_attacks(index, occupied)
+    if kind == ROOK:
+        return rook_attacks(index, occupied)
+    if kind == QUEEN:
+        return queen_attacks(index, occupied)
+    return 0
+
+
+class AttackMaps:
+    """
+    Cached attack maps of one position.
+    Data members:
+    self._attacks_from - the attack bitboard of the piece on each square (0 for an empty square or a king)
+    self._side_maps - squares attacked by each color (white, black), or None until they are asked for again
+    """
+    __slots__ = ("_attacks_from", "_side_maps")
+
+    def __init__(self, board):
+        """
+        Computes the attack maps of a board (either engine) from scratch.
+        """
+        self._attacks_from = [0] * 64
+        self._side_maps = None
+        self.update(board, (1 << 64) - 1)
+
+    def update(self, board, changed):
+        """
+        Brings the maps up to date after the squares in the changed bitboard were emptied, filled or changed pieces.
+        Squares outside changed must not have changed.
+        """
+        pieces, colors = board.get_bitboards()
+        occupied = colors[0] | colors[1]
+        attacks_from = self._attacks_from
+
+        # 1) a slider's attacks end at the first piece on each ray, so they can only change if a square they reached
+        # changed
+        sliders = 0
+        for kind in (BISHOP, ROOK, QUEEN):
+            sliders |= pieces[kind] | pieces[6 + kind]
+        recompute = changed
+        for index in squares_of(sliders & ~changed):
+            if attacks_from[index] & changed:
+                recompute |= SQUARE_BITS[index]
+
+        # 2) recomputing the attacks of every affected square
+        for index in squares_of(recompute):
+            chess_piece = board.piece_at(index)
+            attacks_from[index] = 0 if chess_piece is None else piece_attacks(chess_piece.get_code(), index, occupied)
+
+        self._side_maps = None
+
+    def _get_side_maps(self, board):
+        """
+        Returns (white attack map, black attack map), rebuilding them if the position changed since the last call.
+        """
+        if self._side_maps is None:
+            _, colors = board.get_bitboards()
+            attacks_from = self._attacks_from
+            side_maps = []
+            for color_mask in colors:
+                side_map = 0
+                for index in squares_of(color_mask):
+                    side_map |= attacks_from[index]
+                side_maps.append(side_map)
+            self._side_maps = tuple(side_maps)
+
+        return self._side_maps
+
+    def get_attack_map(self, board, color):
+        """
+        Returns the bitboard of squares color (0 white, 1 black) attacks.
+        """
+        return self._get_side_maps(board)[color]
+
+    def is_attacked(self, board, index, color):
+        """
+        Returns True if color (0 white, 1 black) attacks the square.
+        """
+        return bool(self._get_side_maps(board)[color] & SQUARE_BITS[index])
+
+    def attackers_of(self, board, index, color):
+        """
+        Returns the square indexes of color's pieces (0 white, 1 black) that attack the square.
+        """
+        _, colors = board.get_bitboards()
+        bit = SQUARE_BITS[index]
+        return [square for square in squares_of(colors[color]) if self._attacks_from[square] & bit]
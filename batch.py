@@ -0,0 +1,395 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Batch move validation for many ChessVar games at once. A GameBatch keeps the positions of its games
+# packed into arrays (one row of 64 piece codes per game) from one call to the next, and checks a move per game in a
+# handful of NumPy operations, so the per-move interpreter overhead of make_move is paid once per batch instead of once
+# per move. The moves it makes patch only the squares they changed. NumPy is optional: without it the same calls fall
+# back to checking one game at a time. Run "python batch.py --help" for the benchmark against the one-by-one loop.
+
+import argparse
+import random
+import sys
+import time
+from collections import namedtuple
+
+from ChessVar import ChessVar
+from tables import (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, COLOR_INDEX, BETWEEN, KNIGHT_ATTACKS, KING_ATTACKS,
+                    PAWN_ATTACKS, PAWN_PUSHES, PAWN_DOUBLE_PUSHES, ROOK_LINES, BISHOP_LINES, QUEEN_LINES)
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, see the module description
+    numpy = None
+
+# struct-of-arrays view of many positions:
+# codes - (N, 64) int8 array, the piece code on each square or -1 for an empty square
+# turns - (N,) int8 array, 0 when white is to move and 1 when black is to move
+# active - (N,) bool array, True while the game is unfinished
+PositionBatch = namedtuple("PositionBatch", ["codes", "turns", "active"])
+
+# numpy versions of the move tables, built the first time a batch is validated
+_ARRAY_TABLES = {}
+
+
+def has_numpy():
+    """
+    Returns True if the vectorized (NumPy) path is available.
+    """
+    return numpy is not None
+
+
+def _bitboard_rows(bitboards):
+    """
+    Converts a list of K bitboards to a (K, 64) bool array, one row of 64 squares per bitboard.
+    """
+    packed = numpy.array(bitboards, dtype="<u8").reshape(-1, 1).view(numpy.uint8)
+    return numpy.unpackbits(packed, axis=1, bitorder="little").astype(bool)
+
+
+def _array_tables():
+    """
+    Returns the numpy move tables, building them on first use:
+    reach - (12, 64, 64) bool, [piece code, from, to] True if the piece can reach "to" on an empty board (no pawns)
+    between - (64, 64, 64) bool, [from, to, square] True for the squares strictly between from and to
+    pawn_push, pawn_double, pawn_capture - (2, 64, 64) bool, [color, from, to]
+    """
+    if _ARRAY_TABLES:
+        return _ARRAY_TABLES
+
+    empty = [0] * 64
+    reach_by_kind = {
+        PAWN: empty,
+        KNIGHT: KNIGHT_ATTACKS,
+        BISHOP: BISHOP_LINES,
+        ROOK: ROOK_LINES,
+        QUEEN: QUEEN_LINES,
+        KING: KING_ATTACKS,
+    }
+
+    reach = numpy.zeros((12, 64, 64), dtype=bool)
+    for code in range(12):
+        reach[code] = _bitboard_rows(list(reach_by_kind[code % 6]))
+
+    _ARRAY_TABLES["reach"] = reach
+    _ARRAY_TABLES["between"] = _bitboard_rows([BETWEEN[start][end] for start in range(64) for end in range(64)]
+                                              ).reshape(64, 64, 64)
+    _ARRAY_TABLES["pawn_push"] = numpy.stack([_bitboard_rows(list(PAWN_PUSHES[color])) for color in (0, 1)])
+    _ARRAY_TABLES["pawn_double"] = numpy.stack([_bitboard_rows(list(PAWN_DOUBLE_PUSHES[color])) for color in (0, 1)])
+    _ARRAY_TABLES["pawn_capture"] = numpy.stack([_bitboard_rows(list(PAWN_ATTACKS[color])) for color in (0, 1)])
+
+    return _ARRAY_TABLES
+
+
+def pack_positions(games):
+    """
+    Packs the current positions of a list of ChessVar games into a PositionBatch. Each game contributes its 12 piece
+    bitboards, which are unpacked into piece codes for all games in one go.
+    """
+    count = len(games)
+    bitboards = numpy.array([game.get_bitboards()[0] for game in games], dtype="<u8").reshape(count, 12, 1)
+    bits = numpy.unpackbits(bitboards.view(numpy.uint8), axis=2, bitorder="little")
+
+    # (N, 12, 64) -> (N, 64): the code of the bitboard a square is set in, or -1
+    codes = numpy.where(bits.any(axis=1), bits.argmax(axis=1), -1).astype(numpy.int8)
+    turns = numpy.array([COLOR_INDEX[game.get_turn()] for game in games], dtype=numpy.int8)
+    active = numpy.array([game.get_game_state() == "UNFINISHED" for game in games], dtype=bool)
+
+    return PositionBatch(codes, turns, active)
+
+
+def validate_positions(positions, move_from, move_to):
+    """
+    Vectorized legality check: returns an (N,) bool array telling whether move_from[i] -> move_to[i] (square indexes,
+    anything outside 0-63 is illegal) is legal in position i of a PositionBatch. Applies the same rules as make_move.
+    Requires NumPy.
+    """
+    tables = _array_tables()
+    codes = positions.codes
+    turns = positions.turns.astype(numpy.int64)
+
+    move_from = numpy.asarray(move_from, dtype=numpy.int64)
+    move_to = numpy.asarray(move_to, dtype=numpy.int64)
+    in_bounds = (move_from >= 0) & (move_from < 64) & (move_to >= 0) & (move_to < 64)
+    move_from = numpy.where(in_bounds, move_from, 0)
+    move_to = numpy.where(in_bounds, move_to, 0)
+
+    rows = numpy.arange(len(codes))
+    piece = codes[rows, move_from].astype(numpy.int64)
+    target = codes[rows, move_to].astype(numpy.int64)
+
+    # - there has to be a chess piece of the color whose turn it is on move_from
+    own_piece = (piece >= 0) & (piece // 6 == turns)
+    piece = numpy.where(own_piece, piece, 0)
+    kind = piece % 6
+
+    # - the destination is empty, or holds an enemy piece (never one of your own)
+    target_empty = target < 0
+    target_enemy = ~target_empty & (target // 6 != turns)
+
+    # - nothing may stand between the two squares (only matters for sliding pieces and the pawn's double push)
+    blocked = ((codes >= 0) & tables["between"][move_from, move_to]).any(axis=1)
+
+    # - movement pattern: pawns have their own rules, every other piece uses its reach table
+    pawn_valid = ((tables["pawn_push"][turns, move_from, move_to] & target_empty)
+                  | (tables["pawn_double"][turns, move_from, move_to] & target_empty & ~blocked)
+                  | (tables["pawn_capture"][turns, move_from, move_to] & target_enemy))
+    piece_valid = tables["reach"][piece, move_from, move_to] & ~blocked & (target_empty | target_enemy)
+
+    # - a king can't initiate a capture
+    piece_valid &= ~((kind == KING) & target_enemy)
+
+    return in_bounds & positions.active & own_piece & numpy.where(kind == PAWN, pawn_valid, piece_valid)
+
+
+def validate_moves(requests):
+    """
+    Takes a list of (game, move_from, move_to) tuples (squares as names or indexes; a packed move can be given as
+    move_from with move_to None) and returns a list of booleans telling whether each move is legal in its game right
+    now. No game is changed. Every move is checked with is_move_legal: packing a list of live games into arrays costs
+    more than checking their moves one by one, so the vectorized path is kept for a GameBatch, which packs its games
+    once.
+    """
+    return [game.is_move_legal(move_from, move_to) for game, move_from, move_to in requests]
+
+
+def make_moves(requests):
+    """
+    Batch version of make_move. Takes a list of (game, move_from, move_to) tuples and plays every legal move on its
+    game. Returns a list of booleans, True where the move was made (just like make_move). When the same game shows up
+    more than once, its moves are applied in list order, each one validated against the position the previous one left.
+    """
+    return [game.make_move(move_from, move_to) for game, move_from, move_to in requests]
+
+
+class GameBatch:
+    """
+    A fixed list of ChessVar games kept packed in a PositionBatch between calls, one row per game, so checking one move
+    per game costs a few NumPy operations over the whole batch. Moves made through make_moves update the rows in place
+    from the squares each move changed; a game changed any other way is noticed by its position hash and repacked on
+    the next call. Without NumPy every call falls back to checking one game at a time.
+    Data members:
+    self._games - the games, row i of the batch holds self._games[i]
+    self._positions - PositionBatch of the games' positions (None without NumPy)
+    self._hashes - position hash of every game when its row was last brought up to date
+    self._special_rows - rows of games played under a variant the arrays don't know, checked one by one instead
+    """
+
+    def __init__(self, games):
+        """
+        Creates a batch of a list of ChessVar games and packs their positions. Raises ValueError if a game shows up
+        twice, since every game has exactly one row.
+        """
+        self._games = list(games)
+        if len({id(game) for game in self._games}) != len(self._games):
+            raise ValueError("A game can only be in a GameBatch once")
+        self._hashes = [game.get_position_hash() for game in self._games]
+        self._special_rows = [row for row, game in enumerate(self._games) if not game.get_variant().is_standard()]
+        self._positions = pack_positions(self._games) if numpy is not None and self._games else None
+
+    def get_games(self):
+        """
+        Returns the list of games, in row order.
+        """
+        return self._games
+
+    def get_positions(self):
+        """
+        Returns the PositionBatch of the games' current positions (None without NumPy).
+        """
+        self._refresh()
+        return self._positions
+
+    def _refresh(self):
+        """
+        Repacks the rows of the games whose position changed since their row was last brought up to date.
+        """
+        hashes = [game.get_position_hash() for game in self._games]
+        if hashes == self._hashes:
+            return
+
+        stale = [row for row, (position_hash, packed_hash) in enumerate(zip(hashes, self._hashes))
+                 if position_hash != packed_hash]
+        self._hashes = hashes
+        if self._positions is not None:
+            fresh = pack_positions([self._games[row] for row in stale])
+            self._positions.codes[stale] = fresh.codes
+            self._positions.turns[stale] = fresh.turns
+            self._positions.active[stale] = fresh.active
+
+    def validate(self, move_from, move_to=None):
+        """
+        Takes one move per game, in row order, and returns a list of booleans telling whether each is legal right now.
+        move_from and move_to are sequences of square indexes, or move_from is a sequence of packed moves when move_to
+        is None. No game is changed.
+        """
+        if numpy is None or not self._games:
+            if move_to is None:
+                return [game.is_move_legal(move) for game, move in zip(self._games, move_from)]
+            return [game.is_move_legal(from_index, to_index)
+                    for game, from_index, to_index in zip(self._games, move_from, move_to)]
+
+        # 1) checking every move against the packed rows at once
+        self._refresh()
+        if move_to is None:
+            moves = numpy.asarray(move_from, dtype=numpy.int64)
+            from_indexes = moves & 63
+            to_indexes = (moves >> 6) & 63
+        else:
+            from_indexes = move_from
+            to_indexes = move_to
+        legal = validate_positions(self._positions, from_indexes, to_indexes).tolist()
+
+        # 2) the arrays only know the standard rules, games of other variants are checked one by one
+        for row in self._special_rows:
+            if move_to is None:
+                legal[row] = self._games[row].is_move_legal(int(move_from[row]))
+            else:
+                legal[row] = self._games[row].is_move_legal(int(move_from[row]), int(move_to[row]))
+
+        return legal
+
+    def make_moves(self, move_from, move_to=None):
+        """
+        Batch version of make_move: takes one move per game, like validate, and plays every legal one on its game.
+        Returns a list of booleans, True where the move was made.
+        """
+        legal = self.validate(move_from, move_to)
+        games = self._games
+        moved = [row for row, is_legal in enumerate(legal) if is_legal]
+        if not moved:
+            return legal
+
+        # 1) squares and captures of the moves, read off the rows before any of them changes
+        positions = self._positions
+        if positions is not None:
+            if move_to is None:
+                moves = numpy.asarray(move_from, dtype=numpy.int64)[moved]
+                from_indexes = moves & 63
+                to_indexes = (moves >> 6) & 63
+            else:
+                from_indexes = numpy.asarray(move_from, dtype=numpy.int64)[moved]
+                to_indexes = numpy.asarray(move_to, dtype=numpy.int64)[moved]
+            captures = positions.codes[moved, to_indexes] >= 0
+
+        # 2) playing the moves - a packed move is played as given, its flags (a promotion's piece, for one) included
+        for row in moved:
+            if move_to is None:
+                games[row].make_trusted_move(int(move_from[row]))
+            else:
+                games[row].make_trusted_move(int(move_from[row]) | (int(move_to[row]) << 6))
+            self._hashes[row] = games[row].get_position_hash()
+
+        if positions is None:
+            return legal
+
+        # 3) updating only the squares each move changed. Under the standard rules a quiet move carries its piece code
+        # over, and a capture empties every square it changed (the game may be over then); games of other variants
+        # read their changed squares off the board
+        codes = positions.codes
+        moved = numpy.array(moved)
+        if self._special_rows:
+            special = numpy.isin(moved, self._special_rows)
+            captures &= ~special
+        else:
+            special = numpy.zeros(len(moved), dtype=bool)
+        quiet = ~captures & ~special
+        codes[moved[quiet], to_indexes[quiet]] = codes[moved[quiet], from_indexes[quiet]]
+        codes[moved[quiet], from_indexes[quiet]] = -1
+
+        rows = []
+        squares = []
+        square_codes = []
+        for row in moved[captures].tolist():
+            for index in games[row].get_changed_squares():
+                rows.append(row)
+                squares.append(index)
+                square_codes.append(-1)
+        for row in moved[special].tolist():
+            for index in games[row].get_changed_squares():
+                chess_piece = games[row].get_piece_at(index)
+                rows.append(row)
+                squares.append(index)
+                square_codes.append(-1 if chess_piece is None else chess_piece.get_code())
+        codes[rows, squares] = square_codes
+
+        ended = moved[captures | special]
+        positions.active[ended] = [games[row].get_game_state() == "UNFINISHED" for row in ended.tolist()]
+        positions.turns[moved] ^= 1
+
+        return legal
+
+
+def benchmark(game_count=5000, seed=0, plies=20):
+    """
+    Times checking and making one move in each of game_count games (random positions up to plies plies deep, half of
+    the moves legal) with a GameBatch against calling is_move_legal / make_move game by game. Returns a list of
+    (name, loop seconds, batch seconds).
+    """
+    rng = random.Random(seed)
+    games = []
+    move_from = []
+    move_to = []
+    for _ in range(game_count):
+        game = ChessVar()
+        for _ in range(rng.randrange(plies + 1)):
+            moves = game.generate_legal_moves(encoded=True)
+            if not moves or game.get_game_state() != "UNFINISHED":
+                break
+            game.make_trusted_move(rng.choice(moves))
+        games.append(game)
+
+        moves = game.generate_legal_moves(encoded=True)
+        move = rng.choice(moves) if moves and rng.random() < 0.5 else rng.randrange(4096)
+        move_from.append(move & 63)
+        move_to.append((move >> 6) & 63)
+
+    game_batch = GameBatch(games)
+    timings = []
+
+    # 1) checking the moves
+    start = time.perf_counter()
+    loop_legal = [game.is_move_legal(from_index, to_index)
+                  for game, from_index, to_index in zip(games, move_from, move_to)]
+    loop_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    batch_legal = game_batch.validate(move_from, move_to)
+    timings.append(("validate", loop_seconds, time.perf_counter() - start))
+    if batch_legal != loop_legal:
+        raise AssertionError("GameBatch.validate disagrees with is_move_legal")
+
+    # 2) making them, taking the moves back in between (untimed) so both sides play from the same positions
+    start = time.perf_counter()
+    loop_made = [game.make_move(from_index, to_index) for game, from_index, to_index in zip(games, move_from, move_to)]
+    loop_seconds = time.perf_counter() - start
+    for game, made in zip(games, loop_made):
+        if made:
+            game.unmake_move()
+    start = time.perf_counter()
+    batch_made = game_batch.make_moves(move_from, move_to)
+    timings.append(("make_moves", loop_seconds, time.perf_counter() - start))
+    if batch_made != loop_made:
+        raise AssertionError("GameBatch.make_moves disagrees with make_move")
+
+    return timings
+
+
+def main(argv=None):
+    """
+    Command line entry point: runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="GameBatch benchmark against checking ChessVar games one by one.")
+    parser.add_argument("--games", type=int, default=5000, help="number of games in the batch (default: 5000)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random positions and moves")
+    args = parser.parse_args(argv)
+
+    if numpy is None:
+        print("NumPy is not installed, GameBatch falls back to checking one game at a time")
+    for name, loop_seconds, batch_seconds in benchmark(args.games, args.seed):
+        print(f"{name}: loop {loop_seconds * 1000:.1f}ms, batch {batch_seconds * 1000:.1f}ms, "
+              f"speedup {loop_seconds / batch_seconds:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Board engines used by ChessVar. DictBoard is the original dictionary board (square name -> chess piece)
+# and BitBoard keeps the same position as one 64-bit integer per piece type and color plus occupancy masks.
+
+from tables import (PAWN, KNIGHT, BISHOP, ROOK, KING, SQUARE_NAMES, SQUARE_INDEX, SQUARE_BITS, BETWEEN,
+                    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_PUSHES, PAWN_DOUBLE_PUSHES, ROOK_LINES,
+                    BISHOP_LINES, QUEEN_LINES, BLAST_MASKS, BLAST_SQUARES, squares_of)
+
+# piece codes a blast spares under the standard rules: the pawns of both colors
+PAWN_CODES = (PAWN, 6 + PAWN)
+
+
+class DictBoard(dict):
+    """
+    The original board: a dictionary keyed by square names ("e4") that maps to chess pieces (or None). Move validation
+    is left to each chess piece's is_move_valid. The board also keeps an occupancy mask up to date, which the sliding
+    pieces look their paths up with.
+    """
+
+    def __init__(self):
+        """
+        Creates an empty board.
+        """
+        super().__init__()
+        self._occupied = 0
+
+    def __setitem__(self, key, chess_piece):
+        if chess_piece is None:
+            self._occupied &= ~SQUARE_BITS[SQUARE_INDEX[key]]
+        else:
+            self._occupied |= SQUARE_BITS[SQUARE_INDEX[key]]
+        dict.__setitem__(self, key, chess_piece)
+
+    def get_occupied(self):
+        """
+        Returns the occupancy mask of the whole board.
+        """
+        return self._occupied
+
+    def copy_from(self, other):
+        """
+        Makes this board a copy of another dictionary board, reusing this board's storage.
+        """
+        dict.update(self, other)
+        self._occupied = other._occupied
+
+    def is_move_valid(self, move_from, move_to):
+        """
+        Returns a boolean that tells whether the chess piece at move_from can move to move_to (square indexes).
+        """
+        chess_piece = self[SQUARE_NAMES[move_from]]
+        if chess_piece is None:
+            return False
+
+        return chess_piece.is_move_valid(move_from, move_to, self)
+
+    def piece_at(self, index):
+        """
+        Returns the chess piece at a square index (0-63).
+        """
+        return self[SQUARE_NAMES[index]]
+
+    def get_squares(self):
+        """
+        Returns the chess pieces (or None) on each square, a1 to h8.
+        """
+        return [self[name] for name in SQUARE_NAMES]
+
+    def set_piece(self, index, chess_piece):
+        """
+        Places a chess piece (or None to clear the square) at a square index (0-63).
+        """
+        if chess_piece is None:
+            self._occupied &= ~SQUARE_BITS[index]
+        else:
+            self._occupied |= SQUARE_BITS[index]
+        dict.__setitem__(self, SQUARE_NAMES[index], chess_piece)
+
+    def get_blast_victims(self, origin, blast_masks=BLAST_MASKS, immune_codes=PAWN_CODES):
+        """
+        Returns the square indexes of the chess pieces an explosion at origin removes around it: every occupied square
+        of the precomputed blast (3x3 unless a variant's blast masks are given) except the ones holding an immune piece
+        code (pawns by default).
+        """
+        victims = []
+        blast_squares = BLAST_SQUARES[origin] if blast_masks is BLAST_MASKS else squares_of(blast_masks[origin])
+        for index in blast_squares:
+            chess_piece = self[SQUARE_NAMES[index]]
+            if chess_piece is not None and chess_piece.get_code() not in immune_codes:
+                victims.append(index)
+        return victims
+
+    def get_bitboards(self):
+        """
+        Returns (piece bitboards, color bitboards) for the position. The dictionary board has no masks of its own, so
+        they are built by scanning all 64 squares - fine for comparisons, but the bitboard engine is the fast path.
+        """
+        pieces = [0] * 12
+        colors = [0, 0]
+
+        for index, name in enumerate(SQUARE_NAMES):
+            chess_piece = self[name]
+            if chess_piece is not None:
+                code = chess_piece.get_code()
+                pieces[code] |= 1 << index
+                colors[code >= 6] |= 1 << index
+
+        return pieces, colors
+
+
+class BitBoard:
+    """
+    Board engine built on 64-bit bitboards. Square a1 is bit 0 and h8 is bit 63.
+    Data members:
+    self._pieces - 12 bitboards, one per piece code (color * 6 + kind)
+    self._colors - occupancy mask of each color (white, black)
+    self._occupied - occupancy mask of the whole board
+    self._squares - the chess piece on each of the 64 squares (or None), used to answer lookups in O(1)
+
+    The class also behaves like the dictionary board (board["e4"], board.get("e4"), "e4" in board) so the chess pieces
+    and ChessVar can use either engine without knowing which one they have.
+    """
+    __slots__ = ("_pieces", "_colors", "_occupied", "_squares")
+
+    def __init__(self):
+        """
+        Creates an empty board.
+        """
+        self._pieces = [0] * 12
+        self._colors = [0, 0]
+        self._occupied = 0
+        self._squares = [None] * 64
+
+    def __getitem__(self, key):
+        return self._squares[SQUARE_INDEX[key]]
+
+    def __setitem__(self, key, chess_piece):
+        self.set_piece(SQUARE_INDEX[key], chess_piece)
+
+    def __contains__(self, key):
+        return key in SQUARE_INDEX
+
+    def __iter__(self):
+        return iter(SQUARE_NAMES)
+
+    def __len__(self):
+        return 64
+
+    def get(self, key, default=None):
+        """
+        Returns the chess piece at a square name, or default if the key is not a square on the board.
+        """
+        index = SQUARE_INDEX.get(key)
+        if index is None:
+            return default
+        return self._squares[index]
+
+    def keys(self):
+        """
+        Returns the square names of the board.
+        """
+        return SQUARE_NAMES
+
+    def items(self):
+        """
+        Returns (square name, chess piece) pairs just like the dictionary board.
+        """
+        return zip(SQUARE_NAMES, self._squares)
+
+    def values(self):
+        """
+        Returns the chess pieces (or None) on each square, a1 to h8.
+        """
+        return list(self._squares)
+
+    def get_piece_bitboard(self, code):
+        """
+        Returns the bitboard of a given piece code (color * 6 + kind).
+        """
+        return self._pieces[code]
+
+    def get_color_bitboard(self, color_index):
+        """
+        Returns the occupancy mask of one color (0 for white, 1 for black).
+        """
+        return self._colors[color_index]
+
+    def get_bitboards(self):
+        """
+        Returns (piece bitboards, color bitboards) for the position. These are the engine's own lists, so callers must
+        treat them as read-only.
+        """
+        return self._pieces, self._colors
+
+    def get_occupied(self):
+        """
+        Returns the occupancy mask of the whole board.
+        """
+        return self._occupied
+
+    def copy_from(self, other):
+        """
+        Makes this board a copy of another bitboard board, reusing this board's lists.
+        """
+        self._pieces[:] = other._pieces
+        self._colors[:] = other._colors
+        self._occupied = other._occupied
+        self._squares[:] = other._squares
+
+    def piece_at(self, index):
+        """
+        Returns the chess piece at a square index (0-63).
+        """
+        return self._squares[index]
+
+    def get_squares(self):
+        """
+        Returns the chess pieces (or None) on each square, a1 to h8. Treat the list as read-only.
+        """
+        return self._squares
+
+    def set_piece(self, index, chess_piece):
+        """
+        Places a chess piece (or None to clear the square) at a square index, keeping every bitboard in sync.
+        """
+        bit = 1 << index
+
+        # clearing whatever was on the square before
+        old_piece = self._squares[index]
+        if old_piece is not None:
+            code = old_piece.get_code()
+            self._pieces[code] ^= bit
+            self._colors[code >= 6] ^= bit
+            self._occupied ^= bit
+
+        self._squares[index] = chess_piece
+        if chess_piece is not None:
+            code = chess_piece.get_code()
+            self._pieces[code] |= bit
+            self._colors[code >= 6] |= bit
+            self._occupied |= bit
+
+    def get_blast_victims(self, origin, blast_masks=BLAST_MASKS, immune_codes=PAWN_CODES):
+        """
+        Returns the square indexes of the chess pieces an explosion at origin removes around it. Immunity is a single
+        mask: the precomputed blast (3x3 unless a variant's blast masks are given), minus empty squares, minus every
+        piece of an immune code (pawns by default).
+        """
+        pieces = self._pieces
+        if immune_codes is PAWN_CODES:
+            immune = pieces[PAWN] | pieces[6 + PAWN]
+        else:
+            immune = 0
+            for code in immune_codes:
+                immune |= pieces[code]
+        return squares_of(blast_masks[origin] & self._occupied & ~immune)
+
+    def is_move_valid(self, move_from, move_to):
+        """
+        Returns a boolean that tells whether the chess piece at move_from can move to move_to (square indexes). Paths
+        are checked with a single mask test instead of walking the board.
+        """
+        chess_piece = self._squares[move_from]
+        if chess_piece is None:
+            return False
+
+        code = chess_piece.get_code()
+        color = code >= 6
+        kind = code - 6 if color else code
+        to_bit = 1 << move_to
+
+        # a piece can never land on a square that holds a chess piece of its own color
+        if self._colors[color] & to_bit:
+            return False
+
+        if kind == PAWN:
+            # single push onto an empty square
+            if PAWN_PUSHES[color][move_from] & to_bit:
+                return not self._occupied & to_bit
+
+            # double push from the starting rank, the skipped square has to be empty as well
+            if PAWN_DOUBLE_PUSHES[color][move_from] & to_bit:
+                return not self._occupied & (to_bit | BETWEEN[move_from][move_to])
+
+            # diagonal capture of an enemy chess piece
+            return bool(PAWN_ATTACKS[color][move_from] & self._colors[not color] & to_bit)
+
+        if kind == KNIGHT:
+            return bool(KNIGHT_ATTACKS[move_from] & to_bit)
+
+        if kind == KING:
+            return bool(KING_ATTACKS[move_from] & to_bit)
+
+        # sliding pieces - the line has to suit the piece and nothing may stand in between
+        if kind == ROOK:
+            lines = ROOK_LINES[move_from]
+        elif kind == BISHOP:
+            lines = BISHOP_LINES[move_from]
+        else:
+            lines = QUEEN_LINES[move_from]
+
+        return bool(lines & to_bit) and not self._occupied & BETWEEN[move_from][move_to]
@@ -0,0 +1,197 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Opening book. A book is built from game records by counting which moves were played from each of the
+# opening positions, and written to disk as a table of (position hash, move, weight) entries sorted by hash. Lookups
+# memory-map the file and binary search it, so a book of any size is served without reading it into memory. Run
+# "python book.py --help" for the command line.
+#
+# File layout: 4s magic "ACBK" | B version | 3x reserved | I entry count, then the entries, each
+# Q position hash | H packed move | H weight. All integers are little-endian.
+
+import argparse
+import mmap
+import random
+import struct
+import sys
+
+from ChessVar import ChessVar
+from moves import move_to_string
+from records import read_records
+
+MAGIC = b"ACBK"
+VERSION = 1
+
+HEADER = struct.Struct("<4sB3xI")
+ENTRY = struct.Struct("<QHH")
+HASH = struct.Struct("<Q")
+MAX_WEIGHT = 0xFFFF
+
+
+def count_book_moves(games, max_plies=16, counts=None):
+    """
+    Replays the first max_plies moves of every game (each given as a list of packed moves, or anything with a moves
+    attribute like a records.StoredGame) and counts how often each move was played from each position. Returns a
+    dictionary (position hash, move) -> count; pass counts back in to add more games.
+    """
+    counts = {} if counts is None else counts
+
+    for moves in games:
+        moves = getattr(moves, "moves", moves)
+        game = ChessVar()
+        for move in moves[:max_plies]:
+            key = (game.get_position_hash(), move)
+            if not game.make_move(move):
+                break
+            counts[key] = counts.get(key, 0) + 1
+
+    return counts
+
+
+def write_book(path, counts):
+    """
+    Writes a book file from a (position hash, move) -> count dictionary. Weights are capped at 65535.
+    """
+    entries = sorted(counts.items(), key=lambda item: (item[0][0], -item[1], item[0][1]))
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(entries)))
+        for (position_hash, move), count in entries:
+            file.write(ENTRY.pack(position_hash, move, min(count, MAX_WEIGHT)))
+
+
+def build_book(record_path, book_path, max_plies=16):
+    """
+    Builds a book file from a game record file (see records.py). Returns the number of entries written.
+    """
+    counts = count_book_moves((stored.moves for stored in read_records(record_path)), max_plies)
+    write_book(book_path, counts)
+    return len(counts)
+
+
+class OpeningBook:
+    """
+    Read-only, memory-mapped opening book. Use it as a context manager, or call close() when done.
+    Data members:
+    self._file / self._data - the open book file and its memory map
+    self._count - number of entries in the book
+    """
+
+    def __init__(self, path):
+        """
+        Opens a book file written by write_book.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file can't be mapped
+            self._file.close()
+            raise ValueError(f"{path} is not an opening book") from None
+
+        if len(self._data) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not an opening book")
+        magic, version, self._count = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION or len(self._data) < HEADER.size + self._count * ENTRY.size:
+            self.close()
+            raise ValueError(f"{path} is not an opening book (or is a version this code can't read)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def lookup(self, position_hash):
+        """
+        Returns the (packed move, weight) pairs stored for a position hash, most played first, or an empty list if the
+        position is not in the book.
+        """
+        data = self._data
+        unpack_hash = HASH.unpack_from
+
+        # 1) binary search for the first entry with this hash
+        low = 0
+        high = self._count
+        while low < high:
+            middle = (low + high) >> 1
+            if unpack_hash(data, HEADER.size + middle * ENTRY.size)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+
+        # 2) every entry of a position sits next to each other
+        moves = []
+        offset = HEADER.size + low * ENTRY.size
+        end = HEADER.size + self._count * ENTRY.size
+        while offset < end:
+            entry_hash, move, weight = ENTRY.unpack_from(data, offset)
+            if entry_hash != position_hash:
+                break
+            moves.append((move, weight))
+            offset += ENTRY.size
+
+        return moves
+
+    def get_moves(self, game):
+        """
+        Returns the (packed move, weight) pairs of the book for the current position of a ChessVar game, leaving out
+        any move that isn't legal there (which only a hash collision could cause).
+        """
+        return [(move, weight) for move, weight in self.lookup(game.get_position_hash()) if game.is_move_legal(move)]
+
+    def choose_move(self, game, rng=random):
+        """
+        Picks a book move for a game at random, weighted by how often it was played. Returns a packed move, or None
+        when the position is out of book.
+        """
+        moves = self.get_moves(game)
+        if not moves:
+            return None
+        return rng.choices([move for move, _ in moves], weights=[weight for _, weight in moves])[0]
+
+    def close(self):
+        """
+        Unmaps and closes the book file.
+        """
+        if not self._file.closed:
+            if getattr(self, "_data", None) is not None:
+                self._data.close()
+            self._file.close()
+
+
+def main(argv=None):
+    """
+    Command line entry point: "build" a book from a record file, or "probe" a book at a position.
+    """
+    parser = argparse.ArgumentParser(description="ChessVar opening book.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="build a book from a game record file")
+    build.add_argument("records", help="game record file (see records.py)")
+    build.add_argument("book", help="book file to write")
+    build.add_argument("--plies", type=int, default=16, help="opening plies taken from each game (default: 16)")
+
+    probe = commands.add_parser("probe", help="list the book moves of a position")
+    probe.add_argument("book", help="book file to read")
+    probe.add_argument("--fen", help="position to probe (default: the starting position)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        entries = build_book(args.records, args.book, args.plies)
+        print(f"{entries} entries written to {args.book}")
+        return 0
+
+    with OpeningBook(args.book) as opening_book:
+        game = ChessVar(fen=args.fen) if args.fen else ChessVar()
+        for move, weight in opening_book.get_moves(game):
+            print(f"{move_to_string(move)}: {weight}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Incremental material and piece-square evaluation. ChessVar keeps an Evaluator in step with its board:
+# every piece placed, moved or blown up adjusts the running totals, so evaluate() and material() never rescan the
+# board.
+
+from tables import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+
+# material value of each piece kind (pawn, knight, bishop, rook, queen, king). The king has no material value, losing
+# it ends the game, which the search scores separately
+PIECE_VALUES = (100, 300, 300, 500, 900, 0)
+
+
+def _from_white_view(rows):
+    """
+    Converts a piece-square table written the way a board is printed (rank 8 first, a file first) to a tuple indexed by
+    square index (a1 = 0).
+    """
+    return tuple(value for row in reversed(rows) for value in row)
+
+
+# piece-square bonuses from white's point of view; black uses the same tables mirrored vertically (index ^ 56)
+PIECE_SQUARE_TABLES = {
+    PAWN: _from_white_view((
+        (0, 0, 0, 0, 0, 0, 0, 0),
+        (50, 50, 50, 50, 50, 50, 50, 50),
+        (10, 10, 20, 30, 30, 20, 10, 10),
+        (5, 5, 10, 25, 25, 10, 5, 5),
+        (0, 0, 0, 20, 20, 0, 0, 0),
+        (5, -5, -10, 0, 0, -10, -5, 5),
+        (5, 10, 10, -20, -20, 10, 10, 5),
+        (0, 0, 0, 0, 0, 0, 0, 0),
+    )),
+    KNIGHT: _from_white_view((
+        (-50, -40, -30, -30, -30, -30, -40, -50),
+        (-40, -20, 0, 0, 0, 0, -20, -40),
+        (-30, 0, 10, 15, 15, 10, 0, -30),
+        (-30, 5, 15, 20, 20, 15, 5, -30),
+        (-30, 0, 15, 20, 20, 15, 0, -30),
+        (-30, 5, 10, 15, 15, 10, 5, -30),
+        (-40, -20, 0, 5, 5, 0, -20, -40),
+        (-50, -40, -30, -30, -30, -30, -40, -50),
+    )),
+    BISHOP: _from_white_view((
+        (-20, -10, -10, -10, -10, -10, -10, -20),
+        (-10, 0, 0, 0, 0, 0, 0, -10),
+        (-10, 0, 5, 10, 10, 5, 0, -10),
+        (-10, 5, 5, 10, 10, 5, 5, -10),
+        (-10, 0, 10, 10, 10, 10, 0, -10),
+        (-10, 10, 10, 10, 10, 10, 10, -10),
+        (-10, 5, 0, 0, 0, 0, 5, -10),
+        (-20, -10, -10, -10, -10, -10, -10, -20),
+    )),
+    ROOK: _from_white_view((
+        (0, 0, 0, 0, 0, 0, 0, 0),
+        (5, 10, 10, 10, 10, 10, 10, 5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (0, 0, 0, 5, 5, 0, 0, 0),
+    )),
+    QUEEN: _from_white_view((
+        (-20, -10, -10, -5, -5, -10, -10, -20),
+        (-10, 0, 0, 0, 0, 0, 0, -10),
+        (-10, 0, 5, 5, 5, 5, 0, -10),
+        (-5, 0, 5, 5, 5, 5, 0, -5),
+        (0, 0, 5, 5, 5, 5, 0, -5),
+        (-10, 5, 5, 5, 5, 5, 0, -10),
+        (-10, 0, 5, 0, 0, 0, 0, -10),
+        (-20, -10, -10, -5, -5, -10, -10, -20),
+    )),
+    # with every capture an explosion, a king is safest tucked away on its back rank
+    KING: _from_white_view((
+        (-30, -40, -40, -50, -50, -40, -40, -30),
+        (-30, -40, -40, -50, -50, -40, -40, -30),
+        (-30, -40, -40, -50, -50, -40, -40, -30),
+        (-30, -40, -40, -50, -50, -40, -40, -30),
+        (-20, -30, -30, -40, -40, -30, -30, -20),
+        (-10, -20, -20, -20, -20, -20, -20, -10),
+        (20, 20, 0, 0, 0, 0, 20, 20),
+        (20, 30, 10, 0, 0, 10, 30, 20),
+    )),
+}
+
+# SQUARE_SCORES[code][index] - material plus piece-square bonus of a piece code on a square, from its own side's view
+SQUARE_SCORES = tuple(
+    tuple(PIECE_VALUES[code % 6] + PIECE_SQUARE_TABLES[code % 6][index if code < 6 else index ^ 56]
+          for index in range(64))
+    for code in range(12)
+)
+
+
+class Evaluator:
+    """
+    Running evaluation of one position, updated piece by piece. Where the pieces stand is left to the board (see
+    ChessVar.get_piece_squares), so an evaluator stays a few small lists per game.
+    Data members:
+    self._counts - number of pieces of each piece code
+    self._material - material of each color (white, black)
+    self._scores - material plus piece-square total of each color (white, black)
+    """
+    __slots__ = ("_counts", "_material", "_scores")
+
+    def __init__(self):
+        """
+        Creates the evaluator of an empty board.
+        """
+        self._counts = [0] * 12
+        self._material = [0, 0]
+        self._scores = [0, 0]
+
+    def copy_from(self, other):
+        """
+        Makes this evaluator a copy of another one, reusing this evaluator's lists.
+        """
+        self._counts[:] = other._counts
+        self._material[:] = other._material
+        self._scores[:] = other._scores
+
+    def add(self, code, index):
+        """
+        Records a piece code appearing on a square.
+        """
+        color = code // 6
+        self._counts[code] += 1
+        self._material[color] += PIECE_VALUES[code % 6]
+        self._scores[color] += SQUARE_SCORES[code][index]
+
+    def remove(self, code, index):
+        """
+        Records a piece code leaving the board from a square (captured or exploded).
+        """
+        color = code // 6
+        self._counts[code] -= 1
+        self._material[color] -= PIECE_VALUES[code % 6]
+        self._scores[color] -= SQUARE_SCORES[code][index]
+
+    def move(self, code, move_from, move_to):
+        """
+        Records a piece code moving between two squares without a capture.
+        """
+        scores = SQUARE_SCORES[code]
+        self._scores[code // 6] += scores[move_to] - scores[move_from]
+
+    def evaluate(self, color):
+        """
+        Returns the evaluation (material plus piece-square bonuses) from the point of view of color (0 white, 1 black).
+        """
+        score = self._scores[0] - self._scores[1]
+        return -score if color else score
+
+    def material(self):
+        """
+        Returns the material of each side as (white, black).
+        """
+        return self._material[0], self._material[1]
+
+    def get_count(self, code):
+        """
+        Returns the number of pieces of a piece code on the board.
+        """
+        return self._counts[code]
@@ -0,0 +1,177 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: FEN import/export for ChessVar positions. Castling rights only mean something under a variant with
+# castling (see variants.py), and there is no en passant, so that field is written as "-" and ignored when read; the
+# halfmove clock is not tracked either. Ranks are parsed through a cache since most positions in a large file share
+# most of their rank strings, which keeps bulk loading cheap.
+
+from tables import KING
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+# FEN letter of each piece code (color * 6 + kind), white in upper case
+PIECE_LETTERS = "PNBRQKpnbrqk"
+LETTER_CODES = {letter: code for code, letter in enumerate(PIECE_LETTERS)}
+
+TURNS = {"w": "WHITE", "b": "BLACK"}
+
+# castling rights letters, in the order of their bits
+CASTLING_LETTERS = "KQkq"
+
+# rank string -> tuple of (file, piece code) pairs, filled while parsing
+_RANK_CACHE = {}
+_RANK_CACHE_LIMIT = 1 << 16
+
+
+def _parse_rank(rank):
+    """
+    Returns the (file, piece code) pairs of one FEN rank string like "r1bqkb1r". Raises ValueError if the rank
+    doesn't cover exactly 8 squares.
+    """
+    pieces = _RANK_CACHE.get(rank)
+    if pieces is not None:
+        return pieces
+
+    pieces = []
+    file = 0
+    for letter in rank:
+        if letter in LETTER_CODES:
+            pieces.append((file, LETTER_CODES[letter]))
+            file += 1
+        elif "1" <= letter <= "8":
+            file += ord(letter) - 48
+        else:
+            raise ValueError(f"Invalid character '{letter}' in FEN rank '{rank}'")
+        if file > 8:
+            break
+
+    if file != 8:
+        raise ValueError(f"FEN rank '{rank}' does not cover 8 squares")
+
+    pieces = tuple(pieces)
+    if len(_RANK_CACHE) < _RANK_CACHE_LIMIT:
+        _RANK_CACHE[rank] = pieces
+    return pieces
+
+
+def parse_fen(fen):
+    """
+    Parses a FEN string and returns (pieces, turn, fullmove): pieces is a list of (square index, piece code) pairs, turn
+    is "WHITE" or "BLACK" and fullmove the move number. Only the placement and side to move fields are required.
+    A side may be missing its king - that is a finished game, whose king was blown up - but not have two. Raises
+    ValueError for a malformed FEN or a position with more than one king per side.
+    """
+    fields = fen.split()
+    if len(fields) < 2:
+        raise ValueError(f"FEN needs at least a placement and a side to move: '{fen}'")
+
+    ranks = fields[0].split("/")
+    if len(ranks) != 8:
+        raise ValueError(f"FEN placement needs 8 ranks: '{fields[0]}'")
+
+    if fields[1] not in TURNS:
+        raise ValueError(f"Invalid side to move '{fields[1]}' in FEN")
+
+    fullmove = 1
+    if len(fields) >= 6:
+        if not fields[5].isdigit() or int(fields[5]) < 1:
+            raise ValueError(f"Invalid fullmove number '{fields[5]}' in FEN")
+        fullmove = int(fields[5])
+
+    # FEN lists rank 8 first, square indexes start at a1
+    pieces = []
+    for rank_number, rank in enumerate(ranks):
+        base = (7 - rank_number) * 8
+        for file, code in _parse_rank(rank):
+            pieces.append((base + file, code))
+
+    kings = [code for _, code in pieces if code % 6 == KING]
+    if len(kings) != len(set(kings)):
+        raise ValueError("FEN position has more than one king per side")
+
+    return pieces, TURNS[fields[1]], fullmove
+
+
+def parse_castling(fen):
+    """
+    Returns the castling rights field of a FEN string as rights bits (1 K, 2 Q, 4 k, 8 q), 0 for "-" or a FEN without
+    the field. Raises ValueError for an invalid field.
+    """
+    fields = fen.split()
+    if len(fields) < 3 or fields[2] == "-":
+        return 0
+
+    rights = 0
+    for letter in fields[2]:
+        if letter not in CASTLING_LETTERS:
+            raise ValueError(f"Invalid castling rights '{fields[2]}' in FEN")
+        rights |= 1 << CASTLING_LETTERS.index(letter)
+    return rights
+
+
+def format_fen(codes, turn, fullmove=1, castling_rights=0):
+    """
+    Returns the FEN string of a position given as 64 piece codes (None for an empty square, indexed a1 = 0), the player
+    to move ("WHITE" or "BLACK"), the move number and the castling rights bits (see parse_castling).
+    """
+    ranks = []
+    for rank_start in range(56, -1, -8):
+        rank = ""
+        empty = 0
+        for code in codes[rank_start:rank_start + 8]:
+            if code is None:
+                empty += 1
+            else:
+                if empty:
+                    rank += str(empty)
+                    empty = 0
+                rank += PIECE_LETTERS[code]
+        if empty:
+            rank += str(empty)
+        ranks.append(rank)
+
+    castling = "".join(letter for bit, letter in enumerate(CASTLING_LETTERS) if castling_rights >> bit & 1) or "-"
+    return f"{'/'.join(ranks)} {'w' if turn == 'WHITE' else 'b'} {castling} - 0 {fullmove}"
+
+
+def _fen_lines(source):
+    """
+    Generator over the (line number, FEN) pairs of a file path or any iterable of lines, skipping blank lines and lines
+    starting with "#".
+    """
+    if isinstance(source, str):
+        with open(source) as lines:
+            yield from _fen_lines(lines)
+        return
+
+    for line_number, line in enumerate(source, 1):
+        line = line.strip()
+        if line and line[0] != "#":
+            yield line_number, line
+
+
+def read_fens(source):
+    """
+    Generator over the parsed positions (see parse_fen) of many FEN lines, from a file path or any iterable of lines.
+    Blank lines and lines starting with "#" are skipped. Errors name the offending line number.
+    """
+    for line_number, line in _fen_lines(source):
+        try:
+            yield parse_fen(line)
+        except ValueError as error:
+            raise ValueError(f"Line {line_number}: {error}") from None
+
+
+def load_fens(source, engine="bitboard"):
+    """
+    Generator that yields a ChessVar set up at every position of a FEN file or iterable of lines (see read_fens).
+    """
+    from ChessVar import ChessVar  # imported here since ChessVar imports this module for its own FEN support
+
+    for line_number, line in _fen_lines(source):
+        try:
+            game = ChessVar(engine, fen=line)
+        except ValueError as error:
+            raise ValueError(f"Line {line_number}: {error}") from None
+        yield game
@@ -0,0 +1,245 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Opt-in instrumentation of the ChessVar move pipeline. enable() swaps timing wrappers in for the stages of
+# a move (make_move, validation, each board's pattern check, _play, _handle_explosion, _update_game_state) and disable()
+# puts the original methods back, so a disabled pipeline runs exactly the code it always did. While enabled, the stats
+# hold per-stage call counts and cumulative (inclusive) timings, rejected moves by reason and a histogram of how many
+# pieces each explosion removed.
+
+import time
+from contextlib import contextmanager
+
+from board import BitBoard, DictBoard
+# the rejection reasons are re-exported here, where the stats counting them live
+from ChessVar import ChessVar, GAME_OVER, OUT_OF_BOUNDS, EMPTY_SQUARE, WRONG_TURN, BAD_PATTERN, KING_CAPTURE
+
+# stats currently recording, None while instrumentation is disabled
+_active_stats = None
+
+# (class, method name, original function) of every method swapped out by enable()
+_originals = []
+
+# True while an instrumented make_move runs. Validation is only recorded then: is_move_legal and the callers probing
+# moves through it (opening books, batches) run the same checks without making a move
+_making_move = False
+
+
+class PipelineStats:
+    """
+    Counters collected while instrumentation is enabled.
+    Data members:
+    self._calls - stage name -> number of calls
+    self._seconds - stage name -> cumulative time spent in the stage, including the stages it calls
+    self._rejections - rejection reason -> number of moves make_move turned down for it
+    self._explosions - number of pieces removed -> number of explosions that removed that many
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._seconds = {}
+        self._rejections = {}
+        self._explosions = {}
+
+    def record_call(self, stage, seconds):
+        """
+        Counts one call of a stage that took the given time.
+        """
+        self._calls[stage] = self._calls.get(stage, 0) + 1
+        self._seconds[stage] = self._seconds.get(stage, 0.0) + seconds
+
+    def record_rejection(self, reason):
+        """
+        Counts one move rejected for the given reason.
+        """
+        self._rejections[reason] = self._rejections.get(reason, 0) + 1
+
+    def record_explosion(self, removed):
+        """
+        Counts one explosion that removed the given number of pieces (capturing and captured piece included).
+        """
+        self._explosions[removed] = self._explosions.get(removed, 0) + 1
+
+    def snapshot(self):
+        """
+        Returns a copy of every counter as plain dictionaries:
+        {"stages": {stage: {"calls": n, "seconds": s}}, "rejections": {reason: n}, "explosions": {size: n}}
+        """
+        stages = {stage: {"calls": calls, "seconds": self._seconds[stage]} for stage, calls in self._calls.items()}
+        return {"stages": stages, "rejections": dict(self._rejections),
+                "explosions": dict(sorted(self._explosions.items()))}
+
+    def reset(self):
+        """
+        Sets every counter back to zero.
+        """
+        self._calls.clear()
+        self._seconds.clear()
+        self._rejections.clear()
+        self._explosions.clear()
+
+
+def _timed(stage, function):
+    """
+    Wraps a method so every call is counted and timed under the given stage name.
+    """
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _active_stats.record_call(stage, time.perf_counter() - start)
+
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def _timed_pattern_check(function):
+    """
+    Wraps a board's is_move_valid so calls are counted and timed per kind of chess piece ("is_move_valid.Knight").
+    """
+    def wrapper(board, move_from, move_to):
+        if not _making_move:
+            return function(board, move_from, move_to)
+
+        chess_piece = board.piece_at(move_from)
+        start = time.perf_counter()
+        try:
+            return function(board, move_from, move_to)
+        finally:
+            _active_stats.record_call(f"is_move_valid.{type(chess_piece).__name__}", time.perf_counter() - start)
+
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def _instrumented_make_move(function):
+    """
+    Wraps ChessVar.make_move so it is timed, and marks the validation running inside it as a move being made.
+    """
+    def wrapper(*args, **kwargs):
+        global _making_move
+
+        start = time.perf_counter()
+        _making_move = True
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _making_move = False
+            _active_stats.record_call("make_move", time.perf_counter() - start)
+
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def _instrumented_validate(function):
+    """
+    Wraps ChessVar._validate_move so it is timed and every move make_move turns down is counted by the reason it gives.
+    Validation outside make_move (is_move_legal) is left alone.
+    """
+    def wrapper(game, move_from, move_to):
+        if not _making_move:
+            return function(game, move_from, move_to)
+
+        start = time.perf_counter()
+        result = function(game, move_from, move_to)
+        _active_stats.record_call("validate_move", time.perf_counter() - start)
+        if result.__class__ is not tuple:
+            _active_stats.record_rejection(result)
+        return result
+
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def _instrumented_explosion(function):
+    """
+    Wraps ChessVar._handle_explosion so it is timed and the number of pieces it removed goes into the histogram.
+    """
+    def wrapper(game, move_from, explosion_origin):
+        start = time.perf_counter()
+        exploded_pieces = function(game, move_from, explosion_origin)
+        _active_stats.record_call("handle_explosion", time.perf_counter() - start)
+        _active_stats.record_explosion(len(exploded_pieces) + 2)
+        return exploded_pieces
+
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def _swap(cls, name, wrapper):
+    """
+    Replaces a method of a class with a wrapper around it, remembering the original for disable().
+    """
+    original = cls.__dict__[name]
+    _originals.append((cls, name, original))
+    setattr(cls, name, wrapper(original))
+
+
+def enable(stats=None):
+    """
+    Starts recording into stats (a new PipelineStats by default) and returns it. If instrumentation is already
+    enabled, only the stats object being recorded into changes.
+    """
+    global _active_stats
+
+    _active_stats = stats if stats is not None else PipelineStats()
+    if not _originals:
+        _swap(ChessVar, "make_move", _instrumented_make_move)
+        _swap(ChessVar, "_validate_move", _instrumented_validate)
+        _swap(ChessVar, "_play", lambda function: _timed("play", function))
+        _swap(ChessVar, "_handle_explosion", _instrumented_explosion)
+        _swap(ChessVar, "_update_game_state", lambda function: _timed("update_game_state", function))
+        _swap(BitBoard, "is_move_valid", _timed_pattern_check)
+        _swap(DictBoard, "is_move_valid", _timed_pattern_check)
+
+    return _active_stats
+
+
+def disable():
+    """
+    Stops recording and puts the original methods back. Returns the stats that were being recorded into (or None).
+    """
+    global _active_stats
+
+    while _originals:
+        cls, name, original = _originals.pop()
+        setattr(cls, name, original)
+
+    stats, _active_stats = _active_stats, None
+    return stats
+
+
+def is_enabled():
+    """
+    Returns True while instrumentation is recording.
+    """
+    return _active_stats is not None
+
+
+def snapshot():
+    """
+    Returns a snapshot (see PipelineStats.snapshot) of the stats being recorded, or None while disabled.
+    """
+    return _active_stats.snapshot() if _active_stats is not None else None
+
+
+@contextmanager
+def profile():
+    """
+    Context manager that records the moves made inside the with block into a fresh PipelineStats, which it yields.
+    Whatever was enabled before is restored afterwards:
+
+        with instrumentation.profile() as stats:
+            game.make_move("e2", "e4")
+        print(stats.snapshot())
+    """
+    previous = _active_stats
+    stats = enable(PipelineStats())
+    try:
+        yield stats
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
@@ -0,0 +1,73 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Compact square and move encoding. Squares are integers 0-63 (a1 = 0, h8 = 63) and a move is packed into
+# 16 bits: bits 0-5 hold the starting square, bits 6-11 the destination square and bits 12-15 the move flags. Square
+# names ("e4") are only parsed at the edges of the program, through square_to_index.
+
+from tables import SQUARE_NAMES, SQUARE_INDEX
+
+# move flags (bits 12-15). The standard rules only produce quiet moves, double pawn pushes and captures; variants with
+# castling or promotion (see variants.py) add the castling flags and promotions, which set PROMOTION plus the promoted
+# kind minus KNIGHT in the low two bits (8 knight, 9 bishop, 10 rook, 11 queen). En passant stays reserved
+QUIET = 0
+DOUBLE_PAWN_PUSH = 1
+KING_CASTLE = 2
+QUEEN_CASTLE = 3
+CAPTURE = 4
+EN_PASSANT_CAPTURE = 5
+PROMOTION = 8
+QUEEN_PROMOTION = PROMOTION | 3
+
+NULL_MOVE = 0
+
+
+def square_to_index(square):
+    """
+    Converts a square given as a name ("e4", any case) or an index (0-63) to its index. Returns None if the square is
+    not on the board.
+    """
+    if square.__class__ is int:
+        return square if 0 <= square < 64 else None
+    if square.__class__ is str:
+        return SQUARE_INDEX.get(square.lower())
+    return None
+
+
+def index_to_square(index):
+    """
+    Converts a square index (0-63) to its name ("e4").
+    """
+    return SQUARE_NAMES[index]
+
+
+def encode_move(move_from, move_to, flags=QUIET):
+    """
+    Packs a move into a 16-bit integer. The squares can be names or indexes.
+    """
+    if move_from.__class__ is not int:
+        move_from = SQUARE_INDEX[move_from.lower()]
+    if move_to.__class__ is not int:
+        move_to = SQUARE_INDEX[move_to.lower()]
+    return move_from | (move_to << 6) | (flags << 12)
+
+
+def decode_move(move):
+    """
+    Unpacks a 16-bit move into (from index, to index, flags).
+    """
+    return move & 63, (move >> 6) & 63, move >> 12
+
+
+def move_to_squares(move):
+    """
+    Unpacks a 16-bit move into the (move_from, move_to) pair of square names make_move has always taken.
+    """
+    return SQUARE_NAMES[move & 63], SQUARE_NAMES[(move >> 6) & 63]
+
+
+def move_to_string(move):
+    """
+    Returns a move as a coordinate string like "e2e4".
+    """
+    return SQUARE_NAMES[move & 63] + SQUARE_NAMES[(move >> 6) & 63]
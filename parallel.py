@@ -0,0 +1,197 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Parallel root-split search. The root moves of a position are dealt out across a process pool, every
+# worker runs the usual iterative deepening search (see search.py) over its share of them, and the results are merged
+# at the deepest iteration every worker finished. Workers stop themselves at the shared deadline, and anything not back
+# by then (plus a short grace period) is left out of the merge, so an answer is always ready on time. Run
+# "python parallel.py --help" for the benchmark comparing it against the single-process search.
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from ChessVar import ChessVar, ENGINES
+from moves import move_to_squares
+from perft import POSITIONS, setup_position
+from search import SearchEngine, SearchResult, MATE_BOUND
+from transposition import TranspositionTable
+
+# how long past the deadline the merge waits for worker results to arrive
+DEADLINE_GRACE = 0.25
+
+
+def _search_share(fen, engine, variant, root_moves, max_depth, deadline, table_size):
+    """
+    Runs in the process pool: searches the position of a FEN string, under a variant, over its share of the root moves
+    until max_depth or the deadline (a time.monotonic() value, the same clock in every process). Returns
+    ([(depth, score, best move)] for every finished iteration, nodes searched).
+    """
+    iterations = []
+    result = SearchEngine(TranspositionTable(table_size)).search(
+        ChessVar(engine, fen=fen, variant=variant), max_depth=max_depth,
+        time_limit=max(0.0, deadline - time.monotonic()),
+        on_iteration=lambda iteration: iterations.append((iteration.depth, iteration.score, iteration.best_move)),
+        root_moves=root_moves)
+    return iterations, result.nodes
+
+
+def merge_iterations(shares, max_depth):
+    """
+    Merges the finished iterations of every share into (best move, score, depth searched). Scores are only compared
+    at one depth: the deepest every share reached. A share that stopped deepening on a won or lost score counts as
+    having reached every depth with it. Returns (None, 0, 0) if no share finished an iteration.
+    """
+    if not shares:
+        return None, 0, 0
+
+    # 1) the deepest depth every share can answer for
+    common_depth = max_depth
+    for iterations in shares:
+        if not iterations:
+            return None, 0, 0
+        depth, score, _ = iterations[-1]
+        if abs(score) < MATE_BOUND:
+            common_depth = min(common_depth, depth)
+
+    # 2) each share's best move at that depth, and the best of those
+    best_move, best_score, best_depth = None, None, 0
+    for iterations in shares:
+        depth, score, move = [iteration for iteration in iterations if iteration[0] <= common_depth][-1]
+        if best_score is None or score > best_score:
+            best_move, best_score, best_depth = move, score, depth
+
+    return best_move, best_score, best_depth
+
+
+class ParallelSearch:
+    """
+    Root-split search over a process pool. Use it as a context manager, or call close() when done.
+    Data members:
+    self._workers - number of worker processes (and of shares the root moves are split into)
+    self._table_size - transposition table size of each worker
+    self._executor - the process pool, started on the first search that needs it
+    """
+
+    def __init__(self, workers=None, table_size=1 << 16):
+        """
+        Creates a parallel search over workers processes (default: one per CPU).
+        """
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        if self._workers < 1:
+            raise ValueError("A parallel search needs at least one worker")
+
+        self._table_size = table_size
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_workers(self):
+        """
+        Returns the number of worker processes.
+        """
+        return self._workers
+
+    def search(self, game, max_depth=4, time_limit=None):
+        """
+        Searches the current position of game with the root moves split across the workers and returns a
+        SearchResult. Without a time limit every worker searches to max_depth; with one, the search returns within
+        about time_limit seconds. The game itself is never touched.
+        """
+        start = time.perf_counter()
+        moves = game.generate_legal_moves(encoded=True)
+        if not moves:
+            return SearchResult(None, 0, 0, 0, time.perf_counter() - start, 0.0)
+
+        # 1) dealing the ordered root moves out round robin, so every share gets some of the promising ones
+        ordered = SearchEngine._order_moves(game, moves, None)
+        shares = [ordered[worker::self._workers] for worker in range(min(self._workers, len(ordered)))]
+
+        # 2) searching the shares, all against the same deadline
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._workers)
+        deadline = time.monotonic() + (time_limit if time_limit is not None else 1e9)
+        fen = game.get_fen()
+        futures = [self._executor.submit(_search_share, fen, game.get_engine(), game.get_variant(), share, max_depth,
+                                         deadline, self._table_size)
+                   for share in shares]
+
+        done, not_done = wait(futures, None if time_limit is None else time_limit + DEADLINE_GRACE)
+        for future in not_done:
+            future.cancel()
+
+        # 3) merging whatever came back in time - the first ordered move stands in if nothing did
+        results = [future.result() for future in futures if future in done]
+        nodes = sum(share_nodes for _, share_nodes in results)
+        best_move, score, depth = merge_iterations([iterations for iterations, _ in results], max_depth)
+        if best_move is None:
+            best_move = move_to_squares(ordered[0])
+
+        elapsed = time.perf_counter() - start
+        return SearchResult(best_move, score, depth, nodes, elapsed, nodes / elapsed if elapsed > 0 else 0.0)
+
+    def close(self):
+        """
+        Stops the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def benchmark(positions, max_depth, workers, engine="bitboard"):
+    """
+    Searches every named perft position (see perft.POSITIONS) to max_depth with the single-process search and with a
+    ParallelSearch over workers processes. Returns (name, single-process seconds, parallel seconds) per position.
+    """
+    timings = []
+    with ParallelSearch(workers) as parallel_search:
+        # starting the pool up front, so process start-up doesn't count against the first position
+        parallel_search.search(setup_position("start", engine), max_depth=1)
+
+        for name in positions:
+            game = setup_position(name, engine)
+
+            start = time.perf_counter()
+            SearchEngine(TranspositionTable(1 << 16)).search(game, max_depth=max_depth)
+            single_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parallel_search.search(game, max_depth=max_depth)
+            timings.append((name, single_seconds, time.perf_counter() - start))
+
+    return timings
+
+
+def main(argv=None):
+    """
+    Command line entry point: runs the speedup benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Parallel root-split search benchmark for ChessVar.")
+    parser.add_argument("--position", action="append", choices=sorted(POSITIONS),
+                        help="position to search (can be repeated, default: all)")
+    parser.add_argument("--depth", type=int, default=4, help="search depth (default: 4)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--engine", default="bitboard", choices=ENGINES, help="board engine to use")
+    args = parser.parse_args(argv)
+
+    timings = benchmark(args.position or list(POSITIONS), args.depth, args.workers, args.engine)
+    for name, single_seconds, parallel_seconds in timings:
+        print(f"{name}: single {single_seconds:.3f}s, parallel {parallel_seconds:.3f}s, "
+              f"speedup {single_seconds / parallel_seconds:.2f}x")
+
+    total_single = sum(single_seconds for _, single_seconds, _ in timings)
+    total_parallel = sum(parallel_seconds for _, _, parallel_seconds in timings)
+    print(f"total: single {total_single:.3f}s, parallel {total_parallel:.3f}s, "
+          f"speedup {total_single / total_parallel:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Perft benchmark and node-count regression harness for ChessVar. perft counts the leaf nodes of the move
+# tree to a fixed depth; comparing those counts with stored values catches any change to move legality, and timing
+# them tracks move generation throughput across releases. Run "python perft.py --help" for the options.
+
+import argparse
+import sys
+import time
+
+from ChessVar import ChessVar, ENGINES
+from moves import move_to_string
+
+# test positions, given as the moves that lead to them from the starting position
+POSITIONS = {
+    "start": (),
+    "open-center": (("e2", "e4"), ("d7", "d5")),
+    "italian": (("e2", "e4"), ("e7", "e5"), ("g1", "f3"), ("b8", "c6"), ("f1", "c4"), ("g8", "f6")),
+    "queen-raid": (("d2", "d4"), ("g7", "g5"), ("c1", "g5"), ("e7", "e5"), ("d4", "e5"), ("d7", "d5"), ("d1", "d5")),
+    "king-blast": (("e2", "e4"), ("f7", "f5"), ("d1", "h5"), ("g7", "g6"), ("h5", "g6")),
+}
+
+# expected leaf node counts, indexed by depth - 1
+EXPECTED_COUNTS = {
+    "start": (20, 400, 8902, 197779),
+    "open-center": (31, 895, 28237, 843069),
+    "italian": (32, 899, 28841, 849993),
+    "queen-raid": (41, 856, 35638, 773280),
+    "king-blast": (21, 583, 13482, 376108),
+}
+
+
+def perft(game, depth):
+    """
+    Returns the number of leaf nodes of the move tree of game at the given depth. The game is left as it was passed in.
+    """
+    if depth == 0:
+        return 1
+
+    moves = game.generate_legal_moves(encoded=True)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        game.make_move(move)
+        nodes += perft(game, depth - 1)
+        game.unmake_move()
+
+    return nodes
+
+
+def divide(game, depth):
+    """
+    Returns a dictionary mapping every legal root move ("e2e4") to the perft count below it - handy for finding which
+    move a count mismatch comes from.
+    """
+    counts = {}
+    for move in game.generate_legal_moves(encoded=True):
+        game.make_move(move)
+        counts[move_to_string(move)] = perft(game, depth - 1)
+        game.unmake_move()
+
+    return counts
+
+
+def setup_position(name, engine="bitboard"):
+    """
+    Returns a new ChessVar set up at one of the POSITIONS, or at any position given as a FEN string.
+    """
+    if name not in POSITIONS:
+        return ChessVar(engine, fen=name)
+
+    game = ChessVar(engine)
+    for move in POSITIONS[name]:
+        if not game.make_move(*move):
+            raise ValueError(f"Position '{name}' contains the illegal move {move}")
+
+    return game
+
+
+def run_suite(names=None, max_depth=None, engine="bitboard", out=sys.stdout):
+    """
+    Runs perft on each named position (all of them by default) for every depth with a stored count, up to max_depth.
+    Prints one line per run with the node count, the time taken and nodes/sec. Returns True if every count matched.
+    """
+    all_passed = True
+
+    for name in names or POSITIONS:
+        expected_counts = EXPECTED_COUNTS[name]
+        depth_limit = len(expected_counts) if max_depth is None else min(max_depth, len(expected_counts))
+
+        for depth in range(1, depth_limit + 1):
+            game = setup_position(name, engine)
+            start = time.perf_counter()
+            nodes = perft(game, depth)
+            elapsed = time.perf_counter() - start
+
+            expected = expected_counts[depth - 1]
+            status = "ok" if nodes == expected else f"MISMATCH (expected {expected})"
+            all_passed = all_passed and nodes == expected
+            nodes_per_second = nodes / elapsed if elapsed > 0 else 0.0
+
+            print(f"{name:<12} depth {depth}  {nodes:>10} nodes  {elapsed:8.3f}s  {nodes_per_second:>12,.0f} nodes/s  "
+                  f"{status}", file=out)
+
+    return all_passed
+
+
+def main(argv=None):
+    """
+    Command line entry point. Runs the perft suite (or a divide on one position) and exits with status 1 if any count
+    does not match the stored value.
+    """
+    parser = argparse.ArgumentParser(description="Perft node counts and throughput for ChessVar.")
+    parser.add_argument("--position", action="append", choices=sorted(POSITIONS),
+                        help="position to run (can be repeated, default: all)")
+    parser.add_argument("--depth", type=int, help="maximum depth to run (default: every stored depth)")
+    parser.add_argument("--engine", default="bitboard", choices=ENGINES, help="board engine to use")
+    parser.add_argument("--divide", action="store_true", help="print the count below each root move of a position")
+    parser.add_argument("--fen", help="divide a position given as a FEN string instead of a stored one")
+    args = parser.parse_args(argv)
+
+    if args.divide or args.fen:
+        name = args.fen or (args.position[0] if args.position else "start")
+        depth = args.depth or 1
+        counts = divide(setup_position(name, args.engine), depth)
+        for move, nodes in sorted(counts.items()):
+            print(f"{move}: {nodes}")
+        print(f"total: {sum(counts.values())}")
+        return 0
+
+    passed = run_suite(args.position, args.depth, args.engine)
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
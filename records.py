@@ -0,0 +1,196 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Compact binary game-record format. A record file is an 8-byte file header followed by one record per
+# game: a 4-byte record header (ply count and result) and the packed 16-bit moves of the game (see moves.py),
+# optionally followed by the 64-bit position hash after every move. RecordWriter streams games to disk and
+# read_records walks a memory-mapped file one record at a time, so neither ever holds a whole archive in memory.
+#
+# File header:   4s magic "ACGR" | B version | B flags (bit 0: the records carry position hashes) | H reserved
+# Record header: H ply count | B result (see RESULT_CODES) | B reserved
+# Record body:   ply count * H packed move | ply count * Q position hash (only when the hashes flag is set)
+# All integers are little-endian.
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+from ChessVar import ChessVar
+
+MAGIC = b"ACGR"
+VERSION = 1
+HAS_HASHES = 1
+
+FILE_HEADER = struct.Struct("<4sBBH")
+RECORD_HEADER = struct.Struct("<HBB")
+MAX_PLIES = 0xFFFF
+
+RESULT_CODES = {"UNFINISHED": 0, "WHITE_WON": 1, "BLACK_WON": 2}
+RESULT_NAMES = {code: name for name, code in RESULT_CODES.items()}
+
+# one game read back from a record file. moves and hashes are arrays ("H" and "Q"); hashes is None when the file
+# was written without them
+StoredGame = namedtuple("StoredGame", ["moves", "result", "hashes"])
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _to_bytes(values, typecode):
+    """
+    Returns the little-endian bytes of a sequence of integers.
+    """
+    values = array(typecode, values)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data, typecode):
+    """
+    Returns an array of the little-endian integers stored in data.
+    """
+    values = array(typecode, data)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+class RecordWriter:
+    """
+    Streams games to a record file. Use it as a context manager, or call close() when done.
+    Data members:
+    self._file - the open output file
+    self._with_hashes - True if every record carries the position hash after each move
+    self._games - the number of games written so far
+    """
+
+    def __init__(self, path, with_hashes=False):
+        """
+        Creates (or overwrites) the record file at path and writes its header.
+        """
+        self._file = open(path, "wb")
+        self._with_hashes = with_hashes
+        self._games = 0
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, HAS_HASHES if with_hashes else 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_games_written(self):
+        """
+        Returns the number of games written so far.
+        """
+        return self._games
+
+    def write_game(self, moves, result="UNFINISHED", hashes=None):
+        """
+        Appends one game, given as its packed moves and final game state. hashes (the position hash after each move)
+        is required if the writer was created with_hashes and ignored otherwise.
+        """
+        if len(moves) > MAX_PLIES:
+            raise ValueError(f"A record holds at most {MAX_PLIES} plies, got {len(moves)}")
+        if self._with_hashes and (hashes is None or len(hashes) != len(moves)):
+            raise ValueError("This writer stores position hashes: pass one hash per move")
+
+        self._file.write(RECORD_HEADER.pack(len(moves), RESULT_CODES[result], 0))
+        self._file.write(_to_bytes(moves, "H"))
+        if self._with_hashes:
+            self._file.write(_to_bytes(hashes, "Q"))
+        self._games += 1
+
+    def write_record(self, record):
+        """
+        Appends a game from anything with moves and result attributes, like a selfplay.GameRecord. The position hashes
+        are computed by replaying the moves when the writer stores them.
+        """
+        hashes = None
+        if self._with_hashes:
+            game = ChessVar()
+            hashes = []
+            for move in record.moves:
+                game.make_trusted_move(move)
+                hashes.append(game.get_position_hash())
+
+        self.write_game(record.moves, record.result, hashes)
+
+    def close(self):
+        """
+        Flushes and closes the file.
+        """
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_records(path, shard=0, shards=1):
+    """
+    Generator over the games of a record file, yielding a StoredGame per record. The file is memory-mapped and only
+    the record being yielded is copied out of it. With shards > 1 only every shards-th record is yielded, starting at
+    record number shard, so several processes can split a file between them; the others are skipped by their header.
+    """
+    with open(path, "rb") as file:
+        if file.seek(0, 2) < FILE_HEADER.size:
+            raise ValueError(f"{path} is not a game record file")
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, version, flags, _ = FILE_HEADER.unpack_from(data, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a game record file")
+            if version != VERSION:
+                raise ValueError(f"Unsupported record file version {version}")
+
+            with_hashes = flags & HAS_HASHES
+            offset = FILE_HEADER.size
+            end = len(data)
+            number = 0
+
+            while offset < end:
+                if offset + RECORD_HEADER.size > end:
+                    raise ValueError(f"Truncated record at byte {offset} of {path}")
+                plies, result, _ = RECORD_HEADER.unpack_from(data, offset)
+                offset += RECORD_HEADER.size
+
+                record_end = offset + 2 * plies + (8 * plies if with_hashes else 0)
+                if record_end > end:
+                    raise ValueError(f"Truncated record at byte {offset - RECORD_HEADER.size} of {path}")
+
+                # records of the other shards are skipped without copying anything out
+                other_shard = number % shards != shard
+                number += 1
+                if other_shard:
+                    offset = record_end
+                    continue
+
+                moves = _from_bytes(data[offset:offset + 2 * plies], "H")
+                offset += 2 * plies
+                hashes = None
+                if with_hashes:
+                    hashes = _from_bytes(data[offset:record_end], "Q")
+                offset = record_end
+
+                yield StoredGame(moves, RESULT_NAMES[result], hashes)
+
+
+def replay_records(path, engine="bitboard"):
+    """
+    Generator that replays every game of a record file through make_move and yields (StoredGame, ChessVar) with the
+    game at its final position. Raises ValueError if a move is illegal, a stored hash does not match the replayed
+    position or the final game state differs from the stored result.
+    """
+    for number, stored in enumerate(read_records(path)):
+        game = ChessVar(engine)
+
+        for ply, move in enumerate(stored.moves):
+            if not game.make_move(move):
+                raise ValueError(f"Game {number}: illegal move at ply {ply + 1}")
+            if stored.hashes is not None and game.get_position_hash() != stored.hashes[ply]:
+                raise ValueError(f"Game {number}: position hash mismatch at ply {ply + 1}")
+
+        if game.get_game_state() != stored.result:
+            raise ValueError(f"Game {number}: replay ends {game.get_game_state()}, record says {stored.result}")
+
+        yield stored, game
@@ -0,0 +1,115 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Rendering and serialization of ChessVar boards. A board is first taken as a 64-byte snapshot (one byte
+# per square, a1 to h8: 0 for an empty square, piece code + 1 otherwise) and every output is built from that: the full
+# board text print_board shows, assembled from cached rank lines, and a diff holding only the squares the last move (or
+# its explosion) changed. Writers hand the finished text to the stream in one write call, so rendering boards for many
+# games costs one string build and one write each.
+
+import sys
+
+from fen import format_fen
+from tables import SQUARE_NAMES
+
+EMPTY_GLYPH = "·"
+
+# glyph of each snapshot byte: the empty square, then the piece codes (color * 6 + kind), white first
+SNAPSHOT_GLYPHS = (EMPTY_GLYPH,) + tuple("♙♘♗♖♕♔♟♞♝♜♛♚")
+
+BORDER = " | a b c d e f g h |  \n=====================\n"
+FOOTER = "=====================\n | a b c d e f g h |  \n"
+
+# (rank number, 8 snapshot bytes) -> rendered rank line, filled while rendering
+_RANK_CACHE = {}
+_RANK_CACHE_LIMIT = 1 << 16
+
+
+def _rank_line(rank_number, squares):
+    """
+    Returns the text line of one rank ("8| ♜ ♞ ♝ ♛ ♚ ♝ ♞ ♜ |8\n") from its 8 snapshot bytes, a to h.
+    """
+    key = (rank_number, squares)
+    line = _RANK_CACHE.get(key)
+    if line is None:
+        line = f"{rank_number}| {' '.join([SNAPSHOT_GLYPHS[square] for square in squares])} |{rank_number}\n"
+        if len(_RANK_CACHE) < _RANK_CACHE_LIMIT:
+            _RANK_CACHE[key] = line
+    return line
+
+
+def board_to_string(snapshot):
+    """
+    Returns the full board text of a 64-byte snapshot, rank 8 at the top, exactly as print_board shows it.
+    """
+    return "".join([BORDER] + [_rank_line(rank + 1, snapshot[rank * 8:rank * 8 + 8]) for rank in range(7, -1, -1)]
+                   + [FOOTER])
+
+
+def render_board(game):
+    """
+    Returns the full board text of a ChessVar game.
+    """
+    return board_to_string(game.get_snapshot())
+
+
+def write_board(game, stream=None):
+    """
+    Writes the full board text of a ChessVar game to a stream (standard output by default) in a single write.
+    """
+    (sys.stdout if stream is None else stream).write(board_to_string(game.get_snapshot()))
+
+
+def diff_snapshots(old_snapshot, new_snapshot):
+    """
+    Returns the indexes of the squares that differ between two snapshots, a1 first.
+    """
+    # comparing all 64 squares at once as two big integers, then only walking the bytes that differ
+    difference = int.from_bytes(old_snapshot, "little") ^ int.from_bytes(new_snapshot, "little")
+    squares = []
+    while difference:
+        low_bit = difference & -difference
+        index = (low_bit.bit_length() - 1) >> 3
+        squares.append(index)
+        difference &= ~(0xFF << (index * 8))
+    return squares
+
+
+def diff_to_string(snapshot, squares):
+    """
+    Returns the diff text of the given square indexes of a snapshot: "square glyph" pairs, like "e2 · e4 ♙", and a
+    newline. Nothing changed gives an empty string.
+    """
+    if not squares:
+        return ""
+    return " ".join([f"{SQUARE_NAMES[index]} {SNAPSHOT_GLYPHS[snapshot[index]]}" for index in squares]) + "\n"
+
+
+def render_diff(game, previous_snapshot=None):
+    """
+    Returns the diff text of a ChessVar game: the squares the last move and its explosion changed, or, when a snapshot
+    taken earlier is given, every square that changed since then (however many moves or undos happened in between).
+    """
+    snapshot = game.get_snapshot()
+    if previous_snapshot is None:
+        squares = sorted(game.get_changed_squares())
+    else:
+        squares = diff_snapshots(previous_snapshot, snapshot)
+    return diff_to_string(snapshot, squares)
+
+
+def write_diff(game, stream=None, previous_snapshot=None):
+    """
+    Writes the diff text of a ChessVar game (see render_diff) to a stream (standard output by default) in a single
+    write. Nothing is written when no square changed.
+    """
+    text = render_diff(game, previous_snapshot)
+    if text:
+        (sys.stdout if stream is None else stream).write(text)
+
+
+def snapshot_to_fen(snapshot, turn="WHITE", fullmove=1):
+    """
+    Returns the FEN string of a snapshot, for the side to move and move number given.
+    """
+    return format_fen([None if square == 0 else square - 1 for square in snapshot], turn, fullmove)
@@ -0,0 +1,347 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Atomic-aware alpha-beta search for ChessVar. The engine runs an iterative deepening negamax search with
+# a transposition table, explosion-aware move ordering and a quiescence search over captures, and stops on a node or
+# time budget so a best move is always available within a fixed latency.
+
+import time
+from collections import namedtuple
+
+from evaluation import PIECE_VALUES
+from moves import CAPTURE, move_to_squares
+from tables import KING, COLOR_INDEX, SQUARE_BITS, BLAST_MASKS
+from transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+# score of a won game, minus the number of plies it takes, so quicker wins are preferred
+MATE_SCORE = 100000
+MATE_BOUND = MATE_SCORE - 1000
+
+# value a blast is given for removing a king - large enough to sort king-removing captures first (or last)
+KING_BLAST_VALUE = 50000
+
+INFINITY = MATE_SCORE + 1
+
+# how many nodes are searched between clock checks
+CHECK_INTERVAL = 64
+
+# best_move is a (move_from, move_to) pair of square names, or None if there was no legal move
+SearchResult = namedtuple("SearchResult", ["best_move", "score", "depth", "nodes", "elapsed", "nodes_per_second"])
+
+CAPTURE_BIT = CAPTURE << 12
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the node or time budget runs out. Every make_move on the way back up is undone before
+    the exception leaves the engine.
+    """
+
+
+class SearchEngine:
+    """
+    Negamax alpha-beta search over ChessVar positions.
+    Data members:
+    self._table - transposition table shared by every search this engine runs
+    self._nodes - nodes visited by the current search
+    self._deadline / self._node_limit - the budget of the current search (None when unlimited)
+    """
+
+    def __init__(self, table=None):
+        """
+        Creates a search engine. A TranspositionTable can be passed in to share cached results between engines,
+        otherwise the engine makes its own.
+        """
+        self._table = table if table is not None else TranspositionTable(1 << 18)
+        self._nodes = 0
+        self._deadline = None
+        self._node_limit = None
+
+    def get_table(self):
+        """
+        Returns the transposition table the engine stores its results in.
+        """
+        return self._table
+
+    def search(self, game, max_depth=4, time_limit=None, node_limit=None, on_iteration=None, root_moves=None):
+        """
+        Searches the current position of game and returns a SearchResult. The search deepens one ply at a time up to
+        max_depth and stops early once time_limit seconds or node_limit nodes are spent; the best move of the deepest
+        finished iteration is returned. on_iteration, if given, is called with a SearchResult after every iteration.
+        root_moves, if given, limits the root to those packed moves (see parallel.py). The game is left exactly as it
+        was passed in.
+        """
+        start = time.perf_counter()
+        self._nodes = 0
+        self._deadline = start + time_limit if time_limit is not None else None
+        self._node_limit = node_limit
+        self._table.new_search()
+
+        best_move = None
+        best_score = 0
+        completed_depth = 0
+
+        moves = game.generate_legal_moves(encoded=True)
+        if root_moves is not None:
+            root_moves = set(root_moves)
+            moves = [move for move in moves if move in root_moves]
+        if moves:
+            # always have an answer, even if the very first iteration runs out of time
+            best_move = self._order_moves(game, moves, None)[0]
+
+            for depth in range(1, max_depth + 1):
+                try:
+                    score, move = self._search_root(game, moves, depth, best_move)
+                except SearchTimeout:
+                    break
+
+                best_move, best_score, completed_depth = move, score, depth
+                # a root limited to some of the moves has no score of its own to remember
+                if root_moves is None:
+                    self._table.store(game.get_position_hash(), depth, score, EXACT, move)
+                if on_iteration is not None:
+                    on_iteration(self._make_result(best_move, best_score, completed_depth, start))
+
+                # no point searching deeper once a forced win or loss has been found
+                if abs(best_score) >= MATE_BOUND:
+                    break
+
+        return self._make_result(best_move, best_score, completed_depth, start)
+
+    def _make_result(self, best_move, score, depth, start):
+        """
+        Packs the current search statistics into a SearchResult.
+        """
+        elapsed = time.perf_counter() - start
+        nodes_per_second = self._nodes / elapsed if elapsed > 0 else 0.0
+        squares = move_to_squares(best_move) if best_move is not None else None
+        return SearchResult(squares, score, depth, self._nodes, elapsed, nodes_per_second)
+
+    def _search_root(self, game, moves, depth, previous_best):
+        """
+        Searches the root moves to the given depth, trying the previous iteration's best move first. Returns
+        (score, best packed move).
+        """
+        alpha = -INFINITY
+        beta = INFINITY
+        best_move = None
+
+        for move in self._order_moves(game, moves, previous_best):
+            game.make_move(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, 1)
+            finally:
+                game.unmake_move()
+
+            if score > alpha or best_move is None:
+                alpha = score
+                best_move = move
+
+        return alpha, best_move
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        """
+        Returns the score of the position from the point of view of the player to move.
+        """
+        self._count_node()
+
+        # the game ends as soon as a king is removed - the player to move is the one who just lost (or won) it
+        game_state = game.get_game_state()
+        if game_state != "UNFINISHED":
+            return self._terminal_score(game, game_state, ply)
+
+        if depth <= 0:
+            return self._quiescence(game, alpha, beta, ply)
+
+        # using a cached result when it was searched at least as deep as we need
+        position_hash = game.get_position_hash()
+        entry = self._table.probe(position_hash)
+        table_move = None
+        if entry is not None:
+            table_move = entry.best_move
+            if entry.depth >= depth:
+                score = _score_from_table(entry.score, ply)
+                if entry.flag == EXACT:
+                    return score
+                if entry.flag == LOWER_BOUND and score >= beta:
+                    return score
+                if entry.flag == UPPER_BOUND and score <= alpha:
+                    return score
+
+        moves = game.generate_legal_moves(encoded=True)
+        if not moves:
+            return 0
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = None
+
+        for move in self._order_moves(game, moves, table_move):
+            game.make_move(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.unmake_move()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._table.store(position_hash, depth, _score_to_table(best_score, ply), flag, best_move)
+
+        return best_score
+
+    def _quiescence(self, game, alpha, beta, ply):
+        """
+        Searches captures only, until the position is quiet, so the evaluation is never taken in the middle of an
+        exchange of explosions.
+        """
+        self._count_node()
+
+        game_state = game.get_game_state()
+        if game_state != "UNFINISHED":
+            return self._terminal_score(game, game_state, ply)
+
+        stand_pat = evaluate(game)
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        for move in self._order_moves(game, game.generate_legal_moves(encoded=True), None, captures_only=True):
+            game.make_move(move)
+            try:
+                score = -self._quiescence(game, -beta, -alpha, ply + 1)
+            finally:
+                game.unmake_move()
+
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        return alpha
+
+    @staticmethod
+    def _terminal_score(game, game_state, ply):
+        """
+        Scores a finished game from the point of view of the player to move.
+        """
+        winner = "WHITE" if game_state == "WHITE_WON" else "BLACK"
+        if winner == game.get_turn():
+            return MATE_SCORE - ply
+        return -(MATE_SCORE - ply)
+
+    def _count_node(self):
+        """
+        Counts a visited node and raises SearchTimeout once the budget is spent. The clock is only read every
+        CHECK_INTERVAL nodes since reading it costs about as much as visiting a node.
+        """
+        self._nodes += 1
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            raise SearchTimeout()
+        if self._deadline is not None and self._nodes % CHECK_INTERVAL == 0 and time.perf_counter() >= self._deadline:
+            raise SearchTimeout()
+
+    @staticmethod
+    def _order_moves(game, moves, first_move, captures_only=False):
+        """
+        Orders moves for the search: the cached best move first, then captures by the material their explosion removes
+        (most valuable blast first), then quiet moves. With captures_only the quiet moves are dropped.
+        """
+        pieces, _ = game.get_bitboards()
+        color = COLOR_INDEX[game.get_turn()]
+        variant = game.get_variant()
+        immune = variant.get_immune_mask(pieces)
+        blast_masks = variant.get_blast_masks()
+
+        captures = []
+        quiet_moves = []
+        for move in moves:
+            if move == first_move:
+                continue
+            if move & CAPTURE_BIT:
+                captures.append((blast_value(pieces, color, move & 63, (move >> 6) & 63, immune, blast_masks), move))
+            elif not captures_only:
+                quiet_moves.append(move)
+
+        captures.sort(key=lambda capture: capture[0], reverse=True)
+        ordered = [move for _, move in captures]
+        if first_move is not None and first_move in moves:
+            ordered.insert(0, first_move)
+
+        return ordered + quiet_moves
+
+
+def blast_value(pieces, color, move_from, move_to, immune, blast_masks=BLAST_MASKS):
+    """
+    MVV-LVA adapted for explosions: returns the material a capture removes from the opponent minus the material it
+    removes from the capturing side, counting the victim, the capturing piece and every piece outside the immune
+    bitboard (the pawns, under the standard rules) in the blast around the capture square - 3x3 unless a variant's
+    blast masks are given. Removing a king is worth KING_BLAST_VALUE.
+    """
+    victims = (blast_masks[move_to] & ~immune) | SQUARE_BITS[move_to] | SQUARE_BITS[move_from]
+    value = 0
+
+    for code in range(12):
+        count = bin(pieces[code] & victims).count("1")
+        if count:
+            kind = code % 6
+            piece_value = KING_BLAST_VALUE if kind == KING else PIECE_VALUES[kind]
+            value += count * piece_value if (code >= 6) != color else -count * piece_value
+
+    return value
+
+
+def evaluate(game):
+    """
+    Returns the static evaluation of the position (material plus piece-square bonuses) from the point of view of the
+    player to move. The game keeps it up to date incrementally (see evaluation.py), so this is O(1).
+    """
+    return game.evaluate()
+
+
+def _score_to_table(score, ply):
+    """
+    Stores won/lost scores relative to the stored position instead of the root, so they stay valid at any ply.
+    """
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    """
+    Converts a stored won/lost score back to a score relative to the root.
+    """
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
+
+def find_best_move(game, time_limit=0.05, max_depth=64, table=None, book=None):
+    """
+    Convenience wrapper: searches game for at most time_limit seconds and returns the best (move_from, move_to) pair
+    of square names, or None if the player to move has no legal moves. If an opening book (see book.OpeningBook) is
+    given and has the position, its most played move is returned without searching.
+    """
+    if book is not None:
+        book_moves = game.get_book_moves(book)
+        if book_moves:
+            return book_moves[0]
+
+    return SearchEngine(table).search(game, max_depth=max_depth, time_limit=time_limit).best_move
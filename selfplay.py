@@ -0,0 +1,286 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Multiprocess self-play driver. Games are split into fixed-size shards which a pool of worker processes
+# plays with their own ChessVar instances, streaming every finished game back through a bounded queue. Each shard has
+# its own seed, so the generated games only depend on the base seed and never on the number of workers. Run
+# "python selfplay.py --help" for the options.
+
+import argparse
+import multiprocessing
+import queue
+import random
+import sys
+import time
+import traceback
+from collections import namedtuple
+
+from ChessVar import ChessVar
+from moves import CAPTURE, move_to_squares
+from records import RecordWriter
+from search import SearchEngine, blast_value
+from tables import COLOR_INDEX
+
+# one finished game: moves is the list of packed 16-bit moves that were played, result the final game state
+# ("WHITE_WON", "BLACK_WON", or "UNFINISHED" when the ply limit was reached or the player to move had no move)
+GameRecord = namedtuple("GameRecord", ["game_id", "shard", "moves", "result"])
+
+# summary returned by run_selfplay
+SelfPlayStats = namedtuple("SelfPlayStats", ["games", "plies", "results", "elapsed", "games_per_second"])
+
+CAPTURE_BIT = CAPTURE << 12
+
+# seconds generate_games waits for a result before checking that its workers are still alive
+WORKER_POLL_INTERVAL = 1.0
+
+
+class SelfPlayError(Exception):
+    """
+    Raised by generate_games when a worker process failed. The message holds the worker's traceback, or its exit code
+    if it died without one.
+    """
+
+
+def random_policy(game, moves, rng, engine=None):
+    """
+    Move-selection policy: any legal move, uniformly at random.
+    """
+    return rng.choice(moves)
+
+
+def greedy_policy(game, moves, rng, engine=None):
+    """
+    Move-selection policy: the capture whose explosion wins the most material (see search.blast_value), or a random
+    move when no capture wins anything.
+    """
+    pieces, _ = game.get_bitboards()
+    color = COLOR_INDEX[game.get_turn()]
+    variant = game.get_variant()
+    immune = variant.get_immune_mask(pieces)
+    blast_masks = variant.get_blast_masks()
+
+    best_value = 0
+    best_moves = []
+    for move in moves:
+        if move & CAPTURE_BIT:
+            value = blast_value(pieces, color, move & 63, (move >> 6) & 63, immune, blast_masks)
+            if value > best_value:
+                best_value = value
+                best_moves = [move]
+            elif value == best_value and best_moves:
+                best_moves.append(move)
+
+    return rng.choice(best_moves) if best_moves else rng.choice(moves)
+
+
+def search_policy(game, moves, rng, engine=None, node_limit=2000):
+    """
+    Move-selection policy: the best move of a short alpha-beta search. The search is bounded by nodes instead of time
+    so the chosen moves stay reproducible.
+    """
+    result = engine.search(game, max_depth=64, node_limit=node_limit)
+    if result.best_move is None:
+        return rng.choice(moves)
+
+    for move in moves:
+        if move_to_squares(move) == result.best_move:
+            return move
+    return rng.choice(moves)
+
+
+POLICIES = {"random": random_policy, "greedy": greedy_policy, "search": search_policy}
+
+
+def shard_seed(seed, shard):
+    """
+    Returns the seed of one shard, derived from the base seed so every shard plays its own, reproducible games.
+    """
+    return seed * 1000003 + shard
+
+
+def play_game(game_id, shard, rng, policy="random", max_plies=200, engine=None):
+    """
+    Plays one self-play game and returns its GameRecord. policy is the name of one of the POLICIES; both sides use it.
+    """
+    choose_move = POLICIES[policy]
+    game = ChessVar()
+    moves_played = []
+
+    for _ in range(max_plies):
+        if game.get_game_state() != "UNFINISHED":
+            break
+
+        moves = game.generate_legal_moves(encoded=True)
+        if not moves:
+            break
+
+        move = choose_move(game, moves, rng, engine)
+        game.make_trusted_move(move)
+        moves_played.append(move)
+
+    return GameRecord(game_id, shard, moves_played, game.get_game_state())
+
+
+def play_shard(shard, games, seed, shard_size, policy="random", max_plies=200):
+    """
+    Plays every game of one shard (game ids shard * shard_size up to, but not including, games) and returns the list
+    of GameRecords.
+    """
+    rng = random.Random(shard_seed(seed, shard))
+
+    # a fresh search engine per shard: a node-limited search picks its moves from what its transposition table already
+    # holds, so a table carried over from whichever shards ran before would tie the games to the worker count
+    engine = SearchEngine() if policy == "search" else None
+
+    first_game = shard * shard_size
+    last_game = min(first_game + shard_size, games)
+    return [play_game(game_id, shard, rng, policy, max_plies, engine) for game_id in range(first_game, last_game)]
+
+
+def _worker(shard_queue, result_queue, games, seed, shard_size, policy, max_plies):
+    """
+    Worker process: takes shard numbers off shard_queue until it gets None and puts every finished game on
+    result_queue, then puts None to say it is done - after a SelfPlayError if a shard failed. Blocks while result_queue
+    is full, so a slow consumer holds the workers back instead of letting games pile up in memory.
+    """
+    try:
+        shard = shard_queue.get()
+        while shard is not None:
+            for record in play_shard(shard, games, seed, shard_size, policy, max_plies):
+                result_queue.put(record)
+            shard = shard_queue.get()
+    except Exception:  # handed to the parent, which raises it
+        result_queue.put(SelfPlayError(traceback.format_exc()))
+    finally:
+        result_queue.put(None)
+
+
+def generate_games(games, workers=None, policy="random", seed=0, max_plies=200, shard_size=16, queue_size=256):
+    """
+    Plays games self-play games on workers processes (one per CPU by default) and yields each GameRecord as soon as it
+    is finished. Games arrive in completion order; sort by game_id for a stable order. With workers set to 1 or less
+    everything runs in this process. Raises SelfPlayError if a worker process fails.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}', expected one of {tuple(POLICIES)}")
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+
+    shards = (games + shard_size - 1) // shard_size
+    workers = min(workers or multiprocessing.cpu_count(), shards)
+
+    if workers <= 1:
+        for shard in range(shards):
+            yield from play_shard(shard, games, seed, shard_size, policy, max_plies)
+        return
+
+    shard_queue = multiprocessing.Queue()
+    for shard in range(shards):
+        shard_queue.put(shard)
+    for _ in range(workers):
+        shard_queue.put(None)
+    result_queue = multiprocessing.Queue(maxsize=queue_size)
+
+    processes = [multiprocessing.Process(target=_worker, daemon=True,
+                                         args=(shard_queue, result_queue, games, seed, shard_size, policy, max_plies))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    try:
+        running = workers
+        while running:
+            try:
+                record = result_queue.get(timeout=WORKER_POLL_INTERVAL)
+            except queue.Empty:
+                # a worker that died without saying so (killed, out of memory) would leave this loop waiting forever
+                for process in processes:
+                    if process.exitcode not in (None, 0):
+                        raise SelfPlayError(f"Self-play worker exited with code {process.exitcode}") from None
+                continue
+
+            if record is None:
+                running -= 1
+            elif isinstance(record, SelfPlayError):
+                raise record
+            else:
+                yield record
+    finally:
+        # the consumer may stop early: don't leave workers blocked on a full queue
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+
+def run_selfplay(games, workers=None, policy="random", seed=0, max_plies=200, shard_size=16, on_game=None):
+    """
+    Plays games self-play games and returns a SelfPlayStats summary. on_game, if given, is called with every
+    GameRecord as it arrives (to write it out, for example).
+    """
+    start = time.perf_counter()
+    plies = 0
+    results = {"WHITE_WON": 0, "BLACK_WON": 0, "UNFINISHED": 0}
+    played = 0
+
+    for record in generate_games(games, workers, policy, seed, max_plies, shard_size):
+        played += 1
+        plies += len(record.moves)
+        results[record.result] += 1
+        if on_game is not None:
+            on_game(record)
+
+    elapsed = time.perf_counter() - start
+    games_per_second = played / elapsed if elapsed > 0 else 0.0
+    return SelfPlayStats(played, plies, results, elapsed, games_per_second)
+
+
+def check_determinism(games, workers, policy="random", seed=0, max_plies=200, shard_size=16):
+    """
+    Plays the same games in this process and on workers processes and returns True if both runs produced exactly the
+    same games - which they must, since every shard's games only depend on the base seed.
+    """
+    def played(worker_count):
+        return sorted((record.game_id, record.moves, record.result)
+                      for record in generate_games(games, worker_count, policy, seed, max_plies, shard_size))
+
+    return played(1) == played(workers)
+
+
+def main(argv=None):
+    """
+    Command line entry point. Plays the requested number of games and prints the results and throughput.
+    """
+    parser = argparse.ArgumentParser(description="Multiprocess ChessVar self-play.")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play (default: 100)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--policy", default="random", choices=sorted(POLICIES), help="move-selection policy")
+    parser.add_argument("--seed", type=int, default=0, help="base seed, each shard derives its own from it")
+    parser.add_argument("--max-plies", type=int, default=200, help="plies after which a game is stopped")
+    parser.add_argument("--shard-size", type=int, default=16, help="games per shard")
+    parser.add_argument("--output", help="write the games to this binary record file (see records.py)")
+    parser.add_argument("--hashes", action="store_true", help="store the position hashes in the record file")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that one process and --workers processes play the same games")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        workers = args.workers or multiprocessing.cpu_count()
+        same = check_determinism(args.games, workers, args.policy, args.seed, args.max_plies, args.shard_size)
+        print(f"1 worker vs {workers} workers: {'same games' if same else 'GAMES DIFFER'}")
+        return 0 if same else 1
+
+    if args.output:
+        with RecordWriter(args.output, args.hashes) as writer:
+            stats = run_selfplay(args.games, args.workers, args.policy, args.seed, args.max_plies, args.shard_size,
+                                 writer.write_record)
+    else:
+        stats = run_selfplay(args.games, args.workers, args.policy, args.seed, args.max_plies, args.shard_size)
+    print(f"{stats.games} games, {stats.plies} plies in {stats.elapsed:.3f}s  ({stats.games_per_second:,.1f} games/s)")
+    for result, count in stats.results.items():
+        print(f"{result:<10} {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
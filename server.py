@@ -0,0 +1,342 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: asyncio game server hosting many ChessVar games. Every game is an actor: requests for it are queued and
+# run one at a time, in arrival order, so a ChessVar is never touched by two requests at once and needs no locking.
+# Cheap requests (moves, state) run right on the event loop; searches run in a process pool and bulk validation in a
+# thread, so they never hold up moves in other games. Clients talk a line protocol over TCP or a Unix socket, one
+# request per line and one response line per request, in order:
+#
+#   new [fen]                 -> ok <game id>
+#   move <id> <e2e4>          -> ok <game state>              (err illegal move, if make_move turned it down)
+#   undo <id>                 -> ok <game state>
+#   state <id>                -> ok <game state> <turn> <fen>
+#   moves <id>                -> ok <e2e4> <e7e5> ...
+#   validate <id> <e2e4> ...  -> ok <1|0> <1|0> ...
+#   search <id> <milliseconds> -> ok <e2e4>                   (ok none, if there is no legal move)
+#   close <id>                -> ok
+#   stats                     -> ok games=<n> moves=<n> p50_us=<n> p99_us=<n>
+#
+# A search budget is turned into a number of nodes (see SEARCH_NODES_PER_MILLISECOND), so a search answers the same
+# however loaded the host is and its result can be cached. Run "python server.py --help" for the options.
+
+import argparse
+import asyncio
+import itertools
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from analysis_cache import get_shared_cache
+from batch import validate_moves
+from ChessVar import ChessVar
+from moves import move_to_string
+from search import SearchEngine
+
+# how many make_move service times are kept for the latency percentiles
+LATENCY_WINDOW = 10000
+
+# nodes a search request gets per millisecond of its budget - about what the search manages on one core
+SEARCH_NODES_PER_MILLISECOND = 50
+
+
+class ProtocolError(Exception):
+    """
+    Raised for a request the server can't carry out. Its message is sent back to the client after "err".
+    """
+
+
+def _search_position(fen, node_limit):
+    """
+    Runs in the process pool: searches the position of a FEN string for node_limit nodes and returns the best move as
+    "e2e4" (or None).
+    """
+    best_move = SearchEngine().search(ChessVar(fen=fen), max_depth=64, node_limit=node_limit).best_move
+    return None if best_move is None else best_move[0] + best_move[1]
+
+
+def _split_move(move):
+    """
+    Splits a move written as "e2e4" into its two squares.
+    """
+    if len(move) != 4:
+        raise ProtocolError(f"bad move '{move}'")
+    return move[:2], move[2:]
+
+
+class GameActor:
+    """
+    One hosted game and the queue of requests waiting for it.
+    Data members:
+    self._game - the ChessVar instance, only ever touched by the request at the head of the queue
+    self._queue - pending (function, arguments, future) requests, run in order
+    self._running - True while a task is working through the queue
+    """
+    __slots__ = ("_game", "_queue", "_running")
+
+    def __init__(self, game):
+        self._game = game
+        self._queue = deque()
+        self._running = False
+
+    def submit(self, function, *args):
+        """
+        Queues function(game, *args) - a plain function or a coroutine function - and returns a future for its result.
+        The actor's task is only alive while there is work queued, so idle games cost nothing but their ChessVar.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((function, args, future))
+        if not self._running:
+            self._running = True
+            asyncio.get_running_loop().create_task(self._run())
+        return future
+
+    async def _run(self):
+        """
+        Works through the queue one request at a time.
+        """
+        try:
+            while self._queue:
+                function, args, future = self._queue.popleft()
+                try:
+                    result = function(self._game, *args)
+                    if asyncio.iscoroutine(result):
+                        result = await result
+                except Exception as error:  # handed to whoever is waiting on the request
+                    if not future.done():
+                        future.set_exception(error)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._running = False
+
+
+class GameServer:
+    """
+    Hosts the games and answers protocol requests.
+    Data members:
+    self._actors - game id -> GameActor
+    self._ids - source of new game ids
+    self._max_games - limit on the number of games hosted at once
+    self._executor - process pool searches are sent to
+    self._latencies - the most recent make_move service times, in seconds
+    self._moves - number of moves played since the server started
+    """
+
+    def __init__(self, max_games=100000, search_workers=None, engine="bitboard"):
+        self._actors = {}
+        self._ids = itertools.count(1)
+        self._max_games = max_games
+        self._engine = engine
+        self._executor = ProcessPoolExecutor(search_workers) if search_workers != 0 else None
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._moves = 0
+        self._commands = {
+            "new": self._new_game,
+            "move": self._move,
+            "undo": self._undo,
+            "state": self._state,
+            "moves": self._legal_moves,
+            "validate": self._validate,
+            "search": self._search,
+            "close": self._close,
+            "stats": self._stats,
+        }
+
+    def get_game_count(self):
+        """
+        Returns the number of games currently hosted.
+        """
+        return len(self._actors)
+
+    def get_latency_stats(self):
+        """
+        Returns (p50, p99) of the recent make_move service times in microseconds, (0, 0) before the first move.
+        """
+        if not self._latencies:
+            return 0, 0
+        latencies = sorted(self._latencies)
+        return (round(latencies[len(latencies) // 2] * 1e6),
+                round(latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1e6))
+
+    async def handle_request(self, line):
+        """
+        Carries out one request line and returns the response line (without the newline).
+        """
+        words = line.split()
+        if not words:
+            return "err empty request"
+
+        command = self._commands.get(words[0].lower())
+        if command is None:
+            return f"err unknown command '{words[0]}'"
+
+        try:
+            return "ok " + await command(words[1:])
+        except ProtocolError as error:
+            return f"err {error}"
+        except ValueError as error:
+            return f"err {error}"
+
+    def _actor(self, words):
+        """
+        Returns the actor of the game id at the start of a request's arguments.
+        """
+        if not words:
+            raise ProtocolError("missing game id")
+        actor = self._actors.get(words[0])
+        if actor is None:
+            raise ProtocolError(f"no game '{words[0]}'")
+        return actor
+
+    async def _new_game(self, words):
+        if len(self._actors) >= self._max_games:
+            raise ProtocolError("game limit reached")
+        game = ChessVar(self._engine, fen=" ".join(words)) if words else ChessVar(self._engine)
+        game_id = str(next(self._ids))
+        self._actors[game_id] = GameActor(game)
+        return game_id
+
+    async def _move(self, words):
+        if len(words) != 2:
+            raise ProtocolError("usage: move <id> <e2e4>")
+        move_from, move_to = _split_move(words[1])
+        return await self._actor(words).submit(self._play_move, move_from, move_to)
+
+    def _play_move(self, game, move_from, move_to):
+        """
+        Runs inside the game's actor: makes the move and records how long it took.
+        """
+        start = time.perf_counter()
+        made = game.make_move(move_from, move_to)
+        self._latencies.append(time.perf_counter() - start)
+        if not made:
+            raise ProtocolError("illegal move")
+        self._moves += 1
+        return game.get_game_state()
+
+    async def _undo(self, words):
+        def undo(game):
+            if not game.unmake_move():
+                raise ProtocolError("no move to undo")
+            return game.get_game_state()
+
+        return await self._actor(words).submit(undo)
+
+    async def _state(self, words):
+        return await self._actor(words).submit(
+            lambda game: f"{game.get_game_state()} {game.get_turn()} {game.get_fen()}")
+
+    async def _legal_moves(self, words):
+        return await self._actor(words).submit(
+            lambda game: " ".join(move_to_string(move) for move in game.generate_legal_moves(encoded=True)))
+
+    async def _validate(self, words):
+        squares = [_split_move(move) for move in words[1:]]
+        loop = asyncio.get_running_loop()
+
+        async def validate(game):
+            # the actor waits for the thread, so the game can't change while it is being read
+            requests = [(game, move_from, move_to) for move_from, move_to in squares]
+            legal = await loop.run_in_executor(None, validate_moves, requests)
+            return " ".join("1" if is_legal else "0" for is_legal in legal)
+
+        return await self._actor(words).submit(validate)
+
+    async def _search(self, words):
+        if len(words) != 2 or not words[1].isdigit():
+            raise ProtocolError("usage: search <id> <milliseconds>")
+        node_limit = max(1, int(words[1]) * SEARCH_NODES_PER_MILLISECOND)
+        loop = asyncio.get_running_loop()
+
+        async def search(game):
+            # popular lines get searched over and over, the shared cache answers repeats without a search. Only a search
+            # bounded by nodes can be cached: a timed one would cache whatever a busy host happened to reach
+            cache = get_shared_cache()
+            key = cache.make_key(game, "server-search", node_limit)
+            best_move = cache.get(key)
+            if best_move is None:
+                best_move = await loop.run_in_executor(self._executor, _search_position, game.get_fen(), node_limit)
+                best_move = best_move or "none"
+                cache.put(key, best_move)
+            return best_move
+
+        return await self._actor(words).submit(search)
+
+    async def _close(self, words):
+        actor = self._actor(words)
+        # the game goes once every request already queued for it is done
+        await actor.submit(lambda game: None)
+        self._actors.pop(words[0], None)
+        return words[0]
+
+    async def _stats(self, words):
+        p50, p99 = self.get_latency_stats()
+        return f"games={len(self._actors)} moves={self._moves} p50_us={p50} p99_us={p99}"
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves one client connection: reads request lines and writes the response lines back in order.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                # error replies can echo what the client sent, so anything outside ASCII is replaced both ways
+                response = await self.handle_request(line.decode("ascii", "replace"))
+                writer.write((response + "\n").encode("ascii", "replace"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, unix_path=None):
+        """
+        Listens on a TCP port (or a Unix socket when unix_path is given) until cancelled.
+        """
+        if unix_path is not None:
+            listener = await asyncio.start_unix_server(self.handle_connection, unix_path)
+        else:
+            listener = await asyncio.start_server(self.handle_connection, host, port)
+
+        try:
+            async with listener:
+                await listener.serve_forever()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """
+        Stops the search process pool.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    """
+    Command line entry point. Runs the server until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="asyncio ChessVar game server.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on (default: 8765)")
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--max-games", type=int, default=100000, help="limit on games hosted at once")
+    parser.add_argument("--search-workers", type=int,
+                        help="processes for searches (default: one per CPU, 0 runs them in a thread)")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.max_games, args.search_workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Precomputed square and bitboard tables shared by the board engines. Everything in this module is built
+# once at import time so the engines never have to do chr/ord/int arithmetic while a game is being played.
+
+import random
+
+# piece kinds - used as indexes into the bitboard lists of the board engines
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+
+# color indexes - white pieces use codes 0-5 and black pieces use codes 6-11 (code = color * 6 + kind)
+WHITE, BLACK = 0, 1
+COLOR_INDEX = {"WHITE": WHITE, "BLACK": BLACK}
+COLOR_NAMES = ("WHITE", "BLACK")
+
+FILES = "abcdefgh"
+RANKS = "12345678"
+
+# square names indexed 0-63, a1 = 0, b1 = 1, ..., h1 = 7, a2 = 8, ..., h8 = 63
+SQUARE_NAMES = tuple(f"{letter}{num}" for num in RANKS for letter in FILES)
+SQUARE_INDEX = {name: index for index, name in enumerate(SQUARE_NAMES)}
+
+# file (0-7) and rank (0-7) of every square
+FILE_OF = tuple(index & 7 for index in range(64))
+RANK_OF = tuple(index >> 3 for index in range(64))
+
+# single bit masks of every square
+SQUARE_BITS = tuple(1 << index for index in range(64))
+
+
+def _build_between():
+    """
+    Builds a 64x64 table where BETWEEN[a][b] holds the squares strictly between a and b when both squares share a rank,
+    file or diagonal. Squares that are not aligned (or are neighbours) map to 0.
+    """
+    between = [[0] * 64 for _ in range(64)]
+
+    for start in range(64):
+        for end in range(64):
+            file_diff = FILE_OF[end] - FILE_OF[start]
+            rank_diff = RANK_OF[end] - RANK_OF[start]
+
+            # only straight and diagonal lines have a path
+            if not (file_diff == 0 or rank_diff == 0 or abs(file_diff) == abs(rank_diff)):
+                continue
+
+            distance = max(abs(file_diff), abs(rank_diff))
+            file_step = (file_diff > 0) - (file_diff < 0)
+            rank_step = (rank_diff > 0) - (rank_diff < 0)
+
+            mask = 0
+            for i in range(1, distance):
+                mask |= 1 << ((RANK_OF[start] + i * rank_step) * 8 + FILE_OF[start] + i * file_step)
+            between[start][end] = mask
+
+    return tuple(tuple(row) for row in between)
+
+
+BETWEEN = _build_between()
+
+
+def _build_leaper_attacks(offsets):
+    """
+    Builds the attack table of a piece that jumps by fixed (file, rank) offsets, like the knight or the king.
+    """
+    attacks = []
+    for index in range(64):
+        mask = 0
+        for file_step, rank_step in offsets:
+            new_file = FILE_OF[index] + file_step
+            new_rank = RANK_OF[index] + rank_step
+            if 0 <= new_file < 8 and 0 <= new_rank < 8:
+                mask |= 1 << (new_rank * 8 + new_file)
+        attacks.append(mask)
+    return tuple(attacks)
+
+
+KNIGHT_ATTACKS = _build_leaper_attacks(((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)))
+KING_ATTACKS = _build_leaper_attacks(((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1)))
+
+# diagonal capture squares of a pawn, indexed [color][square]
+PAWN_ATTACKS = (_build_leaper_attacks(((-1, 1), (1, 1))), _build_leaper_attacks(((-1, -1), (1, -1))))
+
+# single push square of a pawn (0 on the last rank), indexed [color][square]
+PAWN_PUSHES = (_build_leaper_attacks(((0, 1),)), _build_leaper_attacks(((0, -1),)))
+
+# double push square of a pawn - only pawns on their starting rank have one, indexed [color][square]
+PAWN_DOUBLE_PUSHES = (
+    tuple(1 << (index + 16) if RANK_OF[index] == 1 else 0 for index in range(64)),
+    tuple(1 << (index - 16) if RANK_OF[index] == 6 else 0 for index in range(64)),
+)
+
+
+def squares_of(bitboard):
+    """
+    Returns the square indexes set in a bitboard, lowest first.
+    """
+    squares = []
+    while bitboard:
+        low_bit = bitboard & -bitboard
+        bitboard ^= low_bit
+        squares.append(low_bit.bit_length() - 1)
+    return squares
+
+
+# the 3x3 blast around every square (not counting the square itself) - both as a mask and as a tuple of square indexes
+BLAST_MASKS = _build_leaper_attacks(((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1)))
+BLAST_SQUARES = tuple(tuple(squares_of(mask)) for mask in BLAST_MASKS)
+
+
+def _build_ray(file_step, rank_step):
+    """
+    Builds the table of rays leaving every square in one direction, up to the edge of the board.
+    """
+    rays = []
+    for index in range(64):
+        mask = 0
+        new_file = FILE_OF[index] + file_step
+        new_rank = RANK_OF[index] + rank_step
+        while 0 <= new_file < 8 and 0 <= new_rank < 8:
+            mask |= 1 << (new_rank * 8 + new_file)
+            new_file += file_step
+            new_rank += rank_step
+        rays.append(mask)
+    return tuple(rays)
+
+
+# rays grouped by whether the squares along them grow (positive) or shrink (negative) in index. The first blocker on a
+# positive ray is its lowest set bit and the first blocker on a negative ray is its highest set bit
+NORTH, EAST, NORTH_EAST, NORTH_WEST = _build_ray(0, 1), _build_ray(1, 0), _build_ray(1, 1), _build_ray(-1, 1)
+SOUTH, WEST, SOUTH_WEST, SOUTH_EAST = _build_ray(0, -1), _build_ray(-1, 0), _build_ray(-1, -1), _build_ray(1, -1)
+
+ROOK_POSITIVE_RAYS = (NORTH, EAST)
+ROOK_NEGATIVE_RAYS = (SOUTH, WEST)
+BISHOP_POSITIVE_RAYS = (NORTH_EAST, NORTH_WEST)
+BISHOP_NEGATIVE_RAYS = (SOUTH_WEST, SOUTH_EAST)
+
+# every square a rook or bishop could reach from a square on an empty board
+ROOK_LINES = tuple(NORTH[i] | EAST[i] | SOUTH[i] | WEST[i] for i in range(64))
+BISHOP_LINES = tuple(NORTH_EAST[i] | NORTH_WEST[i] | SOUTH_WEST[i] | SOUTH_EAST[i] for i in range(64))
+QUEEN_LINES = tuple(ROOK_LINES[i] | BISHOP_LINES[i] for i in range(64))
+
+
+def _slide(index, occupied, positive_rays, negative_rays):
+    """
+    Returns the squares a sliding piece attacks along the given rays. Each ray is cut off just after its first blocker,
+    so the blocker itself is included (it may be a capture). Only used to fill the line tables below.
+    """
+    attacks = 0
+
+    for rays in positive_rays:
+        ray = rays[index]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= rays[(blockers & -blockers).bit_length() - 1]
+        attacks |= ray
+
+    for rays in negative_rays:
+        ray = rays[index]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= rays[blockers.bit_length() - 1]
+        attacks |= ray
+
+    return attacks
+
+
+def _build_line_table(positive_ray, negative_ray):
+    """
+    Builds the occupancy-indexed attack table of one line (rank, file, diagonal or anti-diagonal) through every square.
+    Returns (masks, attacks): masks[index] holds the squares of the line whose occupancy matters - every square on it
+    except the one we stand on and the two ends, since a piece at an end never blocks anything behind it - and
+    attacks[index] maps each occupancy of those squares (occupied & masks[index]) to the squares attacked along the
+    line.
+    """
+    masks = []
+    attacks = []
+
+    for index in range(64):
+        positive = positive_ray[index]
+        negative = negative_ray[index]
+        if positive:
+            positive &= ~(1 << (positive.bit_length() - 1))
+        if negative:
+            negative &= negative - 1
+        mask = positive | negative
+
+        # walking every subset of the mask (carry-rippler trick), starting and ending with the empty set
+        table = {}
+        subset = 0
+        while True:
+            table[subset] = _slide(index, subset, (positive_ray,), (negative_ray,))
+            subset = (subset - mask) & mask
+            if not subset:
+                break
+
+        masks.append(mask)
+        attacks.append(table)
+
+    return tuple(masks), tuple(attacks)
+
+
+# sliding attacks are answered with one table lookup per line: occupied & mask picks the entry
+RANK_MASKS, RANK_ATTACKS = _build_line_table(EAST, WEST)
+FILE_MASKS, FILE_ATTACKS = _build_line_table(NORTH, SOUTH)
+DIAGONAL_MASKS, DIAGONAL_ATTACKS = _build_line_table(NORTH_EAST, SOUTH_WEST)
+ANTI_DIAGONAL_MASKS, ANTI_DIAGONAL_ATTACKS = _build_line_table(NORTH_WEST, SOUTH_EAST)
+
+
+def rook_attacks(index, occupied):
+    """
+    Returns the squares a rook on index attacks given the occupancy mask of the board.
+    """
+    return (RANK_ATTACKS[index][occupied & RANK_MASKS[index]]
+            | FILE_ATTACKS[index][occupied & FILE_MASKS[index]])
+
+
+def bishop_attacks(index, occupied):
+    """
+    Returns the squares a bishop on index attacks given the occupancy mask of the board.
+    """
+    return (DIAGONAL_ATTACKS[index][occupied & DIAGONAL_MASKS[index]]
+            | ANTI_DIAGONAL_ATTACKS[index][occupied & ANTI_DIAGONAL_MASKS[index]])
+
+
+def queen_attacks(index, occupied):
+    """
+    Returns the squares a queen on index attacks given the occupancy mask of the board.
+    """
+    return (RANK_ATTACKS[index][occupied & RANK_MASKS[index]]
+            | FILE_ATTACKS[index][occupied & FILE_MASKS[index]]
+            | DIAGONAL_ATTACKS[index][occupied & DIAGONAL_MASKS[index]]
+            | ANTI_DIAGONAL_ATTACKS[index][occupied & ANTI_DIAGONAL_MASKS[index]])
+
+
+def _build_zobrist_keys(seed=0x41544F4D):
+    """
+    Builds the Zobrist keys: one random 64-bit number per (piece code, square), one for black to move and one per set
+    of castling rights (0 for no rights, so games without castling hash as they always have). A fixed seed keeps
+    position hashes identical across processes and runs, so they can be stored and compared between jobs.
+    """
+    generator = random.Random(seed)
+    piece_keys = tuple(tuple(generator.getrandbits(64) for _ in range(64)) for _ in range(12))
+    black_to_move = generator.getrandbits(64)
+    castling_keys = (0,) + tuple(generator.getrandbits(64) for _ in range(15))
+    return piece_keys, black_to_move, castling_keys
+
+
+ZOBRIST_PIECES, ZOBRIST_BLACK_TO_MOVE, ZOBRIST_CASTLING = _build_zobrist_keys()
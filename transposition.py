@@ -0,0 +1,132 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: A bounded transposition table keyed by the Zobrist hash of a ChessVar position. It caches search
+# results and can also be used on its own to deduplicate positions across analysis jobs.
+
+from collections import namedtuple
+
+# bound types of a stored score
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+TableEntry = namedtuple("TableEntry", ["key", "depth", "score", "flag", "best_move", "generation"])
+
+
+def replace_always(old_entry, new_entry):
+    """
+    Replacement policy: the newest result always wins the slot.
+    """
+    return True
+
+
+def replace_by_depth(old_entry, new_entry):
+    """
+    Replacement policy: keep the deeper search unless the stored entry is for the same position or comes from an
+    older search (see TranspositionTable.new_search).
+    """
+    return (old_entry.key == new_entry.key or old_entry.generation != new_entry.generation
+            or new_entry.depth >= old_entry.depth)
+
+
+REPLACEMENT_POLICIES = {"always": replace_always, "depth": replace_by_depth}
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of TableEntry records. A position hash maps to exactly one slot (hash & mask), so memory
+    stays bounded no matter how many positions are stored; when two positions collide on a slot the replacement policy
+    decides which one is kept.
+    Data members:
+    self._slots - the table itself, None for an empty slot
+    self._mask - size - 1, used to map a hash onto a slot
+    self._replace - function (old_entry, new_entry) -> bool that decides if a new entry may overwrite an old one
+    self._generation - counter bumped by new_search so stale entries can be told apart
+    """
+
+    def __init__(self, size=1 << 20, replacement="depth"):
+        """
+        Creates a table with at least size slots (rounded up to a power of two). replacement is either the name of a
+        built-in policy ("always" or "depth") or a function (old_entry, new_entry) -> bool.
+        """
+        if size < 1:
+            raise ValueError("A transposition table needs at least one slot")
+
+        if callable(replacement):
+            self._replace = replacement
+        elif replacement in REPLACEMENT_POLICIES:
+            self._replace = REPLACEMENT_POLICIES[replacement]
+        else:
+            raise ValueError(f"Unknown replacement policy '{replacement}', expected one of "
+                             f"{tuple(REPLACEMENT_POLICIES)} or a function")
+
+        size = 1 << (size - 1).bit_length()
+        self._slots = [None] * size
+        self._mask = size - 1
+        self._generation = 0
+        self._filled = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return self._filled
+
+    def __contains__(self, key):
+        entry = self._slots[key & self._mask]
+        return entry is not None and entry.key == key
+
+    def get_size(self):
+        """
+        Returns the number of slots in the table.
+        """
+        return len(self._slots)
+
+    def new_search(self):
+        """
+        Marks the start of a new search. Entries from earlier searches stay readable but lose their protection under the
+        "depth" policy.
+        """
+        self._generation += 1
+
+    def probe(self, key):
+        """
+        Returns the TableEntry stored for a position hash, or None if the position is not in the table.
+        """
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry.key == key:
+            self._hits += 1
+            return entry
+
+        self._misses += 1
+        return None
+
+    def store(self, key, depth, score, flag=EXACT, best_move=None):
+        """
+        Stores a result for a position hash if the replacement policy allows it. Returns True if the entry was written.
+        """
+        index = key & self._mask
+        old_entry = self._slots[index]
+        new_entry = TableEntry(key, depth, score, flag, best_move, self._generation)
+
+        if old_entry is None:
+            self._filled += 1
+        elif not self._replace(old_entry, new_entry):
+            return False
+
+        self._slots[index] = new_entry
+        return True
+
+    def clear(self):
+        """
+        Removes every entry and resets the statistics.
+        """
+        self._slots = [None] * len(self._slots)
+        self._generation = 0
+        self._filled = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get_stats(self):
+        """
+        Returns a dictionary with the table size, the number of filled slots and the probe hits and misses.
+        """
+        return {"size": len(self._slots), "filled": self._filled, "hits": self._hits, "misses": self._misses}
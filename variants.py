@@ -0,0 +1,251 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Rules variants of atomic chess. A Variant holds the rule settings a game is played under - how far an
+# explosion reaches, which kinds of pieces survive a blast they weren't part of, and whether pawns promote and kings
+# castle - and compiles them into lookup tables once, when it is created. A ChessVar keeps references to those tables
+# and its move path only ever indexes them, so a variant costs the same per move as the standard rules (ATOMIC) do.
+
+from collections import namedtuple
+
+from board import PAWN_CODES
+from moves import KING_CASTLE, QUEEN_CASTLE, encode_move
+from tables import (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, FILE_OF, RANK_OF, SQUARE_BITS, SQUARE_INDEX,
+                    BLAST_MASKS)
+
+KIND_NAMES = {PAWN: "pawn", KNIGHT: "knight", BISHOP: "bishop", ROOK: "rook", QUEEN: "queen", KING: "king"}
+KIND_LETTERS = "pnbrqk"
+
+# castling rights bits, in FEN order (KQkq)
+WHITE_KING_SIDE = 1
+WHITE_QUEEN_SIDE = 2
+BLACK_KING_SIDE = 4
+BLACK_QUEEN_SIDE = 8
+ALL_CASTLING_RIGHTS = 15
+
+# one way of castling. path holds the squares that must be empty, right the castling rights bit it needs and move the
+# packed move (with its castling flag) that plays it
+Castle = namedtuple("Castle", ["king_code", "king_from", "king_to", "rook_code", "rook_from", "rook_to", "path",
+                               "right", "move"])
+
+# key of the standard atomic rules - cached analysis is only ever shared between games with the same rules key
+STANDARD_KEY = "atomic"
+
+# first and last rank of the board
+RANK_MASKS = (sum(SQUARE_BITS[index] for index in range(8)), sum(SQUARE_BITS[index] for index in range(56, 64)))
+
+
+def _build_blast_masks(radius):
+    """
+    Builds the blast around every square: every square within radius king steps of it, not counting the square itself.
+    """
+    if radius == 1:
+        return BLAST_MASKS
+
+    masks = []
+    for origin in range(64):
+        mask = 0
+        for index in range(64):
+            distance = max(abs(FILE_OF[index] - FILE_OF[origin]), abs(RANK_OF[index] - RANK_OF[origin]))
+            if 0 < distance <= radius:
+                mask |= SQUARE_BITS[index]
+        masks.append(mask)
+    return tuple(masks)
+
+
+def _build_castles():
+    """
+    Builds the four ways of castling of the standard starting position.
+    """
+    castles = []
+    for color, rank in ((0, "1"), (1, "8")):
+        base = color * 6
+        king_from = SQUARE_INDEX["e" + rank]
+        for king_file, rook_from_file, rook_to_file, path_files, right, flag in (
+                ("g", "h", "f", "fg", WHITE_KING_SIDE, KING_CASTLE),
+                ("c", "a", "d", "bcd", WHITE_QUEEN_SIDE, QUEEN_CASTLE)):
+            king_to = SQUARE_INDEX[king_file + rank]
+            path = sum(SQUARE_BITS[SQUARE_INDEX[letter + rank]] for letter in path_files)
+            castles.append(Castle(base + KING, king_from, king_to, base + ROOK, SQUARE_INDEX[rook_from_file + rank],
+                                  SQUARE_INDEX[rook_to_file + rank], path, right << (2 * color),
+                                  encode_move(king_from, king_to, flag)))
+    return tuple(castles)
+
+
+CASTLES = _build_castles()
+
+
+class Variant:
+    """
+    Rule settings of a game, compiled into lookup tables. Variants are immutable; two variants with the same settings
+    compare equal and share a rules key.
+    Data members:
+    self._blast_radius / self._immune_kinds / self._promotion / self._castling - the settings
+    self._blast_masks - the blast around every square (not counting the square itself)
+    self._immune_codes - piece codes that survive a blast they weren't part of
+    self._promotion_targets - per piece code, the squares a quiet move onto promotes it (None without promotion)
+    self._castles - packed move (without flags) -> Castle, empty without castling
+    self._castles_by_color - the Castles of each color (white, black)
+    self._castling_masks - per square, the castling rights kept when a piece moves from, to or off it
+    self._start_rights - castling rights at the starting position
+    self._key - the rules key (see get_key)
+    """
+    __slots__ = ("_blast_radius", "_immune_kinds", "_promotion", "_castling", "_blast_masks", "_immune_codes",
+                 "_promotion_targets", "_castles", "_castles_by_color", "_castling_masks", "_start_rights", "_key")
+
+    def __init__(self, blast_radius=1, immune_kinds=(PAWN,), promotion=False, castling=False):
+        """
+        Creates a variant. blast_radius is how many king steps an explosion reaches (0 removes only the capturing and
+        captured pieces, 1 is the standard 3x3 blast), immune_kinds the kinds of pieces (tables.PAWN ... tables.KING)
+        a blast only removes when they capture or are captured, promotion lets pawns that reach the last rank with a
+        quiet move promote (to a queen unless a packed move asks for another piece) and castling allows castling with
+        an unmoved king and rook over empty squares. Raises ValueError for an invalid setting.
+        """
+        if blast_radius.__class__ is not int or not 0 <= blast_radius <= 7:
+            raise ValueError(f"Blast radius must be an integer from 0 to 7, got {blast_radius!r}")
+        immune_kinds = frozenset(immune_kinds)
+        if not immune_kinds <= set(KIND_NAMES):
+            raise ValueError(f"Unknown piece kinds in {sorted(immune_kinds)}, expected kinds 0-5")
+
+        self._blast_radius = blast_radius
+        self._immune_kinds = immune_kinds
+        self._promotion = bool(promotion)
+        self._castling = bool(castling)
+
+        # 1) explosions
+        self._blast_masks = _build_blast_masks(blast_radius)
+        self._immune_codes = tuple(code for code in range(12) if code % 6 in immune_kinds)
+        if self._immune_codes == PAWN_CODES:
+            self._immune_codes = PAWN_CODES  # the boards have a fast path for the standard immune pieces
+
+        # 2) promotion - only pawns have promotion squares, the last rank seen from their side
+        self._promotion_targets = None
+        if self._promotion:
+            self._promotion_targets = tuple(RANK_MASKS[1 - code // 6] if code % 6 == PAWN else 0 for code in range(12))
+
+        # 3) castling
+        castles = CASTLES if self._castling else ()
+        self._castles = {castle.move & 0xFFF: castle for castle in castles}
+        self._castles_by_color = (tuple(castle for castle in castles if castle.king_code < 6),
+                                  tuple(castle for castle in castles if castle.king_code >= 6))
+        castling_masks = [ALL_CASTLING_RIGHTS] * 64
+        for castle in castles:
+            castling_masks[castle.king_from] &= ~castle.right
+            castling_masks[castle.rook_from] &= ~castle.right
+        self._castling_masks = tuple(castling_masks)
+        self._start_rights = ALL_CASTLING_RIGHTS if self._castling else 0
+
+        # 4) the rules key - the standard rules keep the key they have always had
+        if (blast_radius, immune_kinds, self._promotion, self._castling) == (1, frozenset((PAWN,)), False, False):
+            self._key = STANDARD_KEY
+        else:
+            immune = "".join(KIND_LETTERS[kind] for kind in sorted(immune_kinds)) or "-"
+            self._key = (f"{STANDARD_KEY}:blast={blast_radius}:immune={immune}:promotion={int(self._promotion)}"
+                         f":castling={int(self._castling)}")
+
+    def __eq__(self, other):
+        return isinstance(other, Variant) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __repr__(self):
+        return (f"Variant(blast_radius={self._blast_radius}, immune_kinds={tuple(sorted(self._immune_kinds))}, "
+                f"promotion={self._promotion}, castling={self._castling})")
+
+    def __reduce__(self):
+        # only the settings travel (to worker processes, for instance), the tables are compiled again on arrival
+        return Variant, (self._blast_radius, tuple(sorted(self._immune_kinds)), self._promotion, self._castling)
+
+    def get_key(self):
+        """
+        Returns the rules key: "atomic" for the standard rules, otherwise a string naming every setting.
+        """
+        return self._key
+
+    def is_standard(self):
+        """
+        Returns True if the variant plays the standard atomic rules.
+        """
+        return self._key == STANDARD_KEY
+
+    def get_blast_radius(self):
+        """
+        Returns how many king steps an explosion reaches.
+        """
+        return self._blast_radius
+
+    def get_immune_kinds(self):
+        """
+        Returns the frozenset of piece kinds that survive a blast they weren't part of.
+        """
+        return self._immune_kinds
+
+    def has_promotion(self):
+        """
+        Returns True if pawns promote on the last rank.
+        """
+        return self._promotion
+
+    def has_castling(self):
+        """
+        Returns True if castling is allowed.
+        """
+        return self._castling
+
+    def get_blast_masks(self):
+        """
+        Returns the blast bitboard around every square, not counting the square itself.
+        """
+        return self._blast_masks
+
+    def get_immune_codes(self):
+        """
+        Returns the piece codes that survive a blast they weren't part of.
+        """
+        return self._immune_codes
+
+    def get_immune_mask(self, pieces):
+        """
+        Returns the bitboard of the pieces (given as the 12 piece bitboards) that survive a blast they weren't part of.
+        """
+        immune = 0
+        for code in self._immune_codes:
+            immune |= pieces[code]
+        return immune
+
+    def get_promotion_targets(self):
+        """
+        Returns, per piece code, the bitboard of squares a quiet move onto promotes the piece - or None when the
+        variant has no promotion.
+        """
+        return self._promotion_targets
+
+    def get_castles(self):
+        """
+        Returns a dictionary packed move (squares only, no flags) -> Castle of every way of castling, empty when the
+        variant has no castling.
+        """
+        return self._castles
+
+    def get_castles_by_color(self):
+        """
+        Returns the Castles of white and of black.
+        """
+        return self._castles_by_color
+
+    def get_castling_masks(self):
+        """
+        Returns, per square, the castling rights that survive a piece moving from, to or being blown off it.
+        """
+        return self._castling_masks
+
+    def get_start_rights(self):
+        """
+        Returns the castling rights of the starting position.
+        """
+        return self._start_rights
+
+
+# the standard atomic rules every game is played under unless it is given another variant
+ATOMIC = Variant()
@@ -0,0 +1,142 @@
+# Author: Jesus Rodriguez
+# GitHub username: J-Rodriguez10
+# Date: 10/17/26
+# Description: Bulk replay verifier for game record files (see records.py). Every game is replayed through make_move
+# and its final game state compared with the stored result (and, when the file has them, every position hash with the
+# stored one). One ChessVar per process is reset to the starting position between games instead of building a new one,
+# the file is streamed from its memory map, and several processes can split it record by record. Run
+# "python verify.py --help" for the command line.
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from ChessVar import ChessVar, ENGINES
+from records import read_records
+
+# a game that failed verification. first_illegal and first_hash_mismatch are 0-based move indexes (None if there was
+# none); state is the game state the replay ended in (where the first illegal move stopped it) and expected the
+# stored result
+GameVerdict = namedtuple("GameVerdict", ["number", "first_illegal", "first_hash_mismatch", "state", "expected"])
+
+# totals of a verification run
+VerifyReport = namedtuple("VerifyReport", ["games", "moves", "failures", "elapsed"])
+
+
+def verify_game(game, stored, number=0):
+    """
+    Replays a StoredGame on game (reset to the starting position first) and returns a GameVerdict if it fails
+    verification, or None if every move was legal, every hash matched and the final state is the stored result.
+    Replaying stops at the first illegal move.
+    """
+    game.reset()
+    make_move = game.make_move
+    first_illegal = None
+    first_hash_mismatch = None
+
+    # 1) replaying the moves, checking the hashes only when the record has them
+    hashes = stored.hashes
+    if hashes is None:
+        for ply, move in enumerate(stored.moves):
+            if not make_move(move):
+                first_illegal = ply
+                break
+    else:
+        for ply, move in enumerate(stored.moves):
+            if not make_move(move):
+                first_illegal = ply
+                break
+            if first_hash_mismatch is None and game.get_position_hash() != hashes[ply]:
+                first_hash_mismatch = ply
+
+    # 2) comparing where the game ended with the stored result
+    state = game.get_game_state()
+    if first_illegal is None and first_hash_mismatch is None and state == stored.result:
+        return None
+    return GameVerdict(number, first_illegal, first_hash_mismatch, state, stored.result)
+
+
+def _verify_shard(path, engine, shard, shards):
+    """
+    Verifies every shards-th game of a record file, starting at game number shard, with one reused ChessVar. Returns
+    (games, moves replayed, [GameVerdict]). Runs in the process pool, or in-process for a single shard.
+    """
+    game = ChessVar(engine)
+    games = 0
+    moves = 0
+    failures = []
+
+    for number, stored in enumerate(read_records(path, shard, shards)):
+        verdict = verify_game(game, stored, shard + number * shards)
+        games += 1
+        # only the moves actually replayed count - replaying stops at the first illegal one
+        if verdict is None or verdict.first_illegal is None:
+            moves += len(stored.moves)
+        else:
+            moves += verdict.first_illegal
+        if verdict is not None:
+            failures.append(verdict)
+
+    return games, moves, failures
+
+
+def verify_records(path, workers=1, engine="bitboard"):
+    """
+    Verifies every game of a record file, split across workers processes (workers 1 runs in this process), and
+    returns a VerifyReport. The failures are sorted by game number.
+    """
+    start = time.perf_counter()
+
+    if workers <= 1:
+        shard_results = [_verify_shard(path, engine, 0, 1)]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            shard_results = list(executor.map(_verify_shard, [path] * workers, [engine] * workers, range(workers),
+                                              [workers] * workers))
+
+    failures = sorted((verdict for _, _, verdicts in shard_results for verdict in verdicts),
+                      key=lambda verdict: verdict.number)
+    return VerifyReport(sum(games for games, _, _ in shard_results), sum(moves for _, moves, _ in shard_results),
+                        failures, time.perf_counter() - start)
+
+
+def describe_verdict(verdict):
+    """
+    Returns one line describing why a game failed verification.
+    """
+    if verdict.first_illegal is not None:
+        reason = f"illegal move at index {verdict.first_illegal}"
+    elif verdict.first_hash_mismatch is not None:
+        reason = f"position hash mismatch at index {verdict.first_hash_mismatch}"
+    else:
+        reason = f"replay ends {verdict.state}, record says {verdict.expected}"
+    return f"game {verdict.number}: {reason}"
+
+
+def main(argv=None):
+    """
+    Command line entry point. Verifies a record file, prints every failed game and the throughput, and exits with
+    status 1 if any game failed.
+    """
+    parser = argparse.ArgumentParser(description="Replay and verify the games of a ChessVar record file.")
+    parser.add_argument("records", help="game record file (see records.py)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes to split the file across (default: one per CPU)")
+    parser.add_argument("--engine", default="bitboard", choices=ENGINES, help="board engine to replay on")
+    args = parser.parse_args(argv)
+
+    report = verify_records(args.records, args.workers, args.engine)
+    for verdict in report.failures:
+        print(describe_verdict(verdict))
+
+    elapsed = report.elapsed or 1e-9
+    print(f"{report.games} games, {report.moves} moves, {len(report.failures)} failed in {report.elapsed:.2f}s "
+          f"({report.games / elapsed:.0f} games/s, {report.moves / elapsed:.0f} moves/s)")
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())